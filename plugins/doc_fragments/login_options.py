@@ -24,11 +24,40 @@ options:
     default: http
   cafile:
     description:
-      - Path to ca file
+      - Path to a CA bundle used to verify the server certificates when I(auth_scheme=https).
+      - The system CA certificates are used when neither I(cafile) nor I(capath) is set.
     type: str
+  capath:
+    description:
+      - Path to a directory of hashed CA certificates used to verify the server certificates when I(auth_scheme=https).
+    type: str
+  client_cert:
+    description:
+      - Path to a PEM client certificate presented to the server when I(auth_scheme=https).
+      - May also contain the private key.
+    type: str
+  client_key:
+    description:
+      - Path to the private key of I(client_cert) when it is stored in a separate file.
+    type: str
+  ssl_verify_mode:
+    description:
+      - How the server certificates are verified when I(auth_scheme=https).
+      - C(full) verifies the certificate chain and the hostname.
+      - C(certificate) verifies the certificate chain only, I(capath) can't be used with it.
+      - C(none) disables verification.
+      - TLS client arguments such as C(verify_certs) or C(ca_certs) can only be given in I(connection_options)
+        when I(cafile), I(capath), I(client_cert) and I(client_key) are unset and I(ssl_verify_mode=full).
+    type: str
+    choices:
+      - full
+      - certificate
+      - none
+    default: full
   connection_options:
     description:
       - Additional connection options for Elasticsearch
+      - The dicts are merged and passed as keyword arguments to the Elasticsearch client.
     type: list
     elements: dict
     default: []
@@ -62,9 +91,203 @@ options:
       - Response timeout in seconds.
     type: int
     default: 30
+  pool_maxsize:
+    description:
+      - The maximum number of connections kept open to each node.
+      - Passed as C(maxsize) to version 7 and C(connections_per_node) to version 8 of the client.
+    type: int
+  sniff_on_start:
+    description:
+      - Discover the nodes of the cluster on startup so requests are spread over all of them
+        rather than only I(login_hosts).
+    type: bool
+    default: false
+  sniff_on_connection_fail:
+    description:
+      - Discover the nodes of the cluster again when a connection fails.
+    type: bool
+    default: false
+  sniffer_timeout:
+    description:
+      - Discover the nodes of the cluster again when this many seconds have passed since the last discovery.
+    type: int
+  retry_on_timeout:
+    description:
+      - Retry a request on another node when it times out.
+    type: bool
+    default: false
+  retries:
+    description:
+      - The number of times a request failing with a transient error is retried.
+      - Connection errors, responses with a status in I(retry_on_status) and, with I(retry_on_timeout), timeouts are retried.
+      - Retries wait for a jittered exponential backoff and are sent to the next host of I(login_hosts).
+      - Only requests that can be repeated safely, such as reads, C(PUT) of settings and objects or deletes, are retried.
+        Writes such as indexing documents, reindexing or rolling over an index are never retried.
+      - Replaces the retries of the client itself, which are disabled when I(retries) is set.
+    type: int
+    default: 0
+  retry_on_status:
+    description:
+      - The HTTP status codes that are retried when I(retries) is set.
+    type: list
+    elements: int
+    default: [429, 502, 503, 504]
+  retry_max_delay:
+    description:
+      - The maximum number of seconds to wait between retries.
+    type: int
+    default: 30
+  async_requests:
+    description:
+      - Issue independent requests concurrently with the asyncio client in modules that support it.
+      - Used by M(community.elastic.elastic_index) to create several indexes at once.
+      - Requires the aiohttp Python library, the requests are issued one after another without it
+        and when I(trace) is set.
+      - I(retries) is not applied to the concurrent requests.
+    type: bool
+    default: false
+  trace:
+    description:
+      - Record the method, path, status, request and response size in bytes, the time spent
+        server side (took) and the client round trip time (rtt) in ms of each HTTP request.
+      - The records are returned as C(trace) in the module result unless I(trace_file) is set.
+    type: bool
+    default: false
+  trace_file:
+    description:
+      - Append the records of I(trace) to this file, one JSON object per line, instead of returning them.
+      - Allows the requests of several tasks to be collected and compared.
+    type: path
+  cache:
+    description:
+      - Compare against a snapshot of the cluster metadata stored under C(~/.ansible/tmp/elastic_cache) instead of
+        requesting the cluster on every task. Only writes are sent to the cluster.
+      - Each kind of object, such as all the roles or all the index templates, is fetched with a single request
+        the first time a module needs it. Indexes are the exception, only the indexes a task requests by name
+        are fetched and cached.
+      - The snapshot is discarded when I(cache_ttl) expires, when the cluster state version changes and when a
+        module changes the cluster.
+      - Users and roles are not part of the cluster state, changes made outside of the collection are only
+        seen once I(cache_ttl) expires.
+      - Used by M(community.elastic.elastic_index_info), M(community.elastic.elastic_index_template),
+        M(community.elastic.elastic_component_template), M(community.elastic.elastic_index_lifecycle),
+        M(community.elastic.elastic_pipeline), M(community.elastic.elastic_role) and M(community.elastic.elastic_user).
+    type: bool
+    default: false
+  cache_ttl:
+    description:
+      - The number of seconds a snapshot of I(cache) is used for.
+    type: int
+    default: 300
+  broker:
+    description:
+      - Connect through a local broker process that keeps pooled connections to the cluster open between tasks.
+      - The broker is started on first use on the host running the module and listens on 127.0.0.1 only.
+      - Requests are only accepted with a token stored in a file readable by the current user.
+      - Saves the TCP and TLS handshakes of every task in long playbooks.
+      - The sniffing options are ignored when the broker is used and I(pool_maxsize) sets the
+        number of connections the broker keeps open to each host, 10 by default.
+      - A request that fails on one host is sent to the next one only when the connection could not be
+        opened or the request is a C(GET) or C(HEAD), so writes are never repeated.
+    type: bool
+    default: false
+  broker_idle_timeout:
+    description:
+      - Number of seconds without requests after which the broker exits.
+    type: int
+    default: 300
+  broker_read_timeout:
+    description:
+      - Number of seconds the broker waits for a response from the cluster before failing the request.
+      - Must be longer than the server side waits, such as health checks, of the tasks using the broker.
+    type: int
+    default: 120
 notes:
   - Requires the elasticsearch Python module.
 
 requirements:
   - elasticsearch
 '''
+
+    # Options of the modules that can run against several clusters
+    CLUSTERS = r'''
+options:
+  clusters:
+    description:
+      - Run the module against each of these clusters instead of the cluster given by I(login_hosts).
+      - The clusters are handled concurrently and the result for each one is returned in C(clusters).
+      - Options not set for a cluster are taken from the module options.
+    type: list
+    elements: dict
+    suboptions:
+      name:
+        description:
+          - A name identifying the cluster in the results.
+        type: str
+        required: true
+      login_hosts:
+        description:
+          - The hosts of the cluster.
+        type: list
+        elements: str
+      login_port:
+        description:
+          - The port of the cluster.
+        type: int
+      auth_method:
+        description:
+          - Authentication method.
+        type: str
+        choices:
+          - ''
+          - http_auth
+      auth_scheme:
+        description:
+          - Authentication scheme.
+        type: str
+        choices:
+          - http
+          - https
+      login_user:
+        description:
+          - The user to login with.
+        type: str
+      login_password:
+        description:
+          - The password to login with.
+        type: str
+      cafile:
+        description:
+          - Path to Certificate Authority file.
+        type: str
+      capath:
+        description:
+          - Path to a directory of Certificate Authority files.
+        type: str
+      client_cert:
+        description:
+          - Path to the client certificate.
+        type: str
+      client_key:
+        description:
+          - Path to the client key.
+        type: str
+      ssl_verify_mode:
+        description:
+          - How the server certificate is verified.
+        type: str
+        choices:
+          - full
+          - certificate
+          - none
+      connection_options:
+        description:
+          - Additional connection options.
+        type: list
+        elements: dict
+  cluster_concurrency:
+    description:
+      - The maximum number of I(clusters) handled at the same time.
+    type: int
+    default: 10
+'''
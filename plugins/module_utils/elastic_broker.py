@@ -0,0 +1,262 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import errno
+import fcntl
+import hashlib
+import json
+import os
+import socket
+import threading
+import time
+import uuid
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+except ImportError:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+
+
+BROKER_DIR = os.path.expanduser('~/.ansible/tmp/elastic_broker')
+TOKEN_HEADER = 'X-Elastic-Broker-Token'
+HOP_BY_HOP_HEADERS = [
+    'connection',
+    'keep-alive',
+    'proxy-authenticate',
+    'proxy-authorization',
+    'te',
+    'trailers',
+    'transfer-encoding',
+    'upgrade',
+    'content-length',
+    'host',
+    TOKEN_HEADER.lower()
+]
+# Requests that can be sent again to another host after a failure, other
+# requests are only sent again when the connection could not be opened
+IDEMPOTENT_METHODS = ['GET', 'HEAD']
+
+
+def broker_key(hosts, tls_options, maxsize, read_timeout):
+    '''
+    Return a key identifying a broker for a set of upstream hosts and pool settings
+    '''
+    key = json.dumps({"hosts": hosts, "tls": tls_options, "maxsize": maxsize, "read_timeout": read_timeout}, sort_keys=True)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+
+
+def read_state(state_file):
+    try:
+        with open(state_file) as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def broker_alive(state):
+    '''
+    Return true if the broker described by state is accepting connections
+    '''
+    if state is None:
+        return False
+    try:
+        os.kill(state['pid'], 0)
+    except OSError:
+        return False
+    try:
+        sock = socket.create_connection(('127.0.0.1', state['port']), timeout=1)
+        sock.close()
+    except (socket.error, socket.timeout):
+        return False
+    return True
+
+
+class ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+
+
+class Broker():
+    """
+    Forwards HTTP requests received on localhost to the Elasticsearch hosts
+    using a pool of persistent connections.
+
+    """
+    def __init__(self, hosts, tls_options, token, idle_timeout, maxsize, read_timeout):
+        import urllib3
+        from ansible_collections.community.elastic.plugins.module_utils.elastic_common import ssl_context
+
+        self.connect_errors = (urllib3.exceptions.ConnectTimeoutError,)
+        timeout = urllib3.Timeout(connect=min(10, read_timeout), read=read_timeout)
+        self.pools = []
+        for host in hosts:
+            if host.startswith('https'):
+                # urllib3 resets the verify mode of the context from cert_reqs and
+                # matches the hostname itself unless assert_hostname is False
+                mode = tls_options['ssl_verify_mode']
+                self.pools.append(urllib3.connection_from_url(host,
+                                                              maxsize=maxsize,
+                                                              timeout=timeout,
+                                                              ssl_context=ssl_context(**tls_options),
+                                                              cert_reqs='CERT_NONE' if mode == 'none' else 'CERT_REQUIRED',
+                                                              assert_hostname=None if mode == 'full' else False))
+            else:
+                self.pools.append(urllib3.connection_from_url(host, maxsize=maxsize, timeout=timeout))
+        self.token = token
+        self.idle_timeout = idle_timeout
+        self.last_request = time.time()
+        self.next_pool = 0
+        self.lock = threading.Lock()
+
+    def pools_in_order(self):
+        '''
+        Round robin over the upstream pools, the remaining pools are used for failover
+        '''
+        with self.lock:
+            self.last_request = time.time()
+            start = self.next_pool
+            self.next_pool = (self.next_pool + 1) % len(self.pools)
+        return self.pools[start:] + self.pools[:start]
+
+    def forward(self, method, path, headers, body):
+        last_error = None
+        try:
+            for pool in self.pools_in_order():
+                try:
+                    response = pool.urlopen(method, path,
+                                            body=body,
+                                            headers=headers,
+                                            retries=False,
+                                            redirect=False,
+                                            preload_content=False,
+                                            decode_content=False)
+                    data = response.read(decode_content=False)
+                    response.release_conn()
+                    return response.status, list(response.headers.items()), data
+                except self.connect_errors as excep:
+                    # The request was not sent so it is safe to try the next host
+                    last_error = excep
+                except Exception as excep:
+                    if method not in IDEMPOTENT_METHODS:
+                        raise
+                    last_error = excep
+            raise last_error
+        finally:
+            self.last_request = time.time()
+
+    def handler(self):
+        broker = self
+
+        class BrokerRequestHandler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def log_message(self, format, *args):
+                pass
+
+            def handle_any(self):
+                if self.headers.get(TOKEN_HEADER) != broker.token:
+                    self.send_response(403)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                length = int(self.headers.get('Content-Length') or 0)
+                body = self.rfile.read(length) if length > 0 else None
+                headers = dict((k, v) for k, v in self.headers.items() if k.lower() not in HOP_BY_HOP_HEADERS)
+                try:
+                    status, response_headers, data = broker.forward(self.command, self.path, headers, body)
+                except Exception as excep:
+                    status = 502
+                    response_headers = [('Content-Type', 'text/plain')]
+                    data = str(excep).encode('utf-8')
+                self.send_response(status)
+                for k, v in response_headers:
+                    if k.lower() not in HOP_BY_HOP_HEADERS:
+                        self.send_header(k, v)
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                if self.command != 'HEAD':
+                    self.wfile.write(data)
+
+            do_GET = do_POST = do_PUT = do_DELETE = do_HEAD = handle_any
+
+        return BrokerRequestHandler
+
+    def serve(self, state_file):
+        server = ThreadingHTTPServer(('127.0.0.1', 0), self.handler())
+
+        def watch_idle():
+            while time.time() - self.last_request < self.idle_timeout:
+                time.sleep(1)
+            server.shutdown()
+
+        watcher = threading.Thread(target=watch_idle)
+        watcher.daemon = True
+        watcher.start()
+
+        state = {"pid": os.getpid(), "port": server.server_address[1], "token": self.token}
+        tmp_file = state_file + '.tmp'
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(state, f)
+        os.rename(tmp_file, state_file)
+        try:
+            server.serve_forever()
+        finally:
+            server.server_close()
+            try:
+                if read_state(state_file) == state:
+                    os.remove(state_file)
+            except OSError:
+                pass
+
+
+def daemonize_broker(hosts, tls_options, idle_timeout, maxsize, read_timeout, state_file):
+    '''
+    Start the broker in a detached process so it outlives the module
+    '''
+    pid = os.fork()
+    if pid != 0:
+        os.waitpid(pid, 0)
+        return
+    try:
+        os.setsid()
+        if os.fork() != 0:
+            os._exit(0)
+        devnull = os.open(os.devnull, os.O_RDWR)
+        for fd in (0, 1, 2):
+            os.dup2(devnull, fd)
+        # Release the lock and the pipes to the Ansible worker inherited from the module
+        os.closerange(3, 65536)
+        Broker(hosts, tls_options, uuid.uuid4().hex, idle_timeout, maxsize, read_timeout).serve(state_file)
+    finally:
+        os._exit(0)
+
+
+def ensure_broker(hosts, tls_options, idle_timeout, maxsize=10, read_timeout=120, start_timeout=10):
+    '''
+    Return the state (pid, port and token) of a running broker for the hosts,
+    starting one if needed.
+    '''
+    try:
+        os.makedirs(BROKER_DIR, 0o700)
+    except OSError as excep:
+        if excep.errno != errno.EEXIST:
+            raise
+    key = broker_key(hosts, tls_options, maxsize, read_timeout)
+    state_file = os.path.join(BROKER_DIR, key + '.json')
+    with open(os.path.join(BROKER_DIR, key + '.lock'), 'w') as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        state = read_state(state_file)
+        if broker_alive(state):
+            return state
+        if state is not None:
+            os.remove(state_file)
+        daemonize_broker(hosts, tls_options, idle_timeout, maxsize, read_timeout, state_file)
+        start = time.time()
+        while time.time() - start < start_timeout:
+            state = read_state(state_file)
+            if broker_alive(state):
+                return state
+            time.sleep(0.05)
+    raise Exception("The connection broker did not start within {0} seconds.".format(start_timeout))
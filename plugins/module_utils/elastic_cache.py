@@ -0,0 +1,140 @@
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import errno
+import hashlib
+import json
+import os
+import time
+
+
+CACHE_DIR = os.path.expanduser('~/.ansible/tmp/elastic_cache')
+
+
+def response_body(response):
+    if hasattr(response, 'body'):  # Required for Elasticsearch 8.x
+        return response.body
+    return dict(response)
+
+
+def by_name(items, key):
+    return dict((item['name'], item) for item in items.get(key, []))
+
+
+# Each section is fetched with a single request returning every object of its kind
+SECTIONS = {
+    "index_templates": lambda client: by_name(response_body(client.indices.get_index_template()), 'index_templates'),
+    "component_templates": lambda client: by_name(response_body(client.cluster.get_component_template()), 'component_templates'),
+    "ilm": lambda client: response_body(client.ilm.get_lifecycle()),
+    "pipelines": lambda client: response_body(client.ingest.get_pipeline()),
+    "roles": lambda client: response_body(client.security.get_role()),
+    "users": lambda client: response_body(client.security.get_user()),
+}
+
+# Sections fetched per object, only the objects requested by a module are cached
+ENTRIES = {
+    "indices": lambda client, names: response_body(client.indices.get(index=",".join(names), ignore_unavailable=True)),
+}
+
+
+def cache_key(hosts, user):
+    '''
+    Return a key identifying the cache of a cluster as seen by a user
+    '''
+    key = json.dumps({"hosts": hosts, "user": user}, sort_keys=True)
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()[:16]
+
+
+def state_version(client):
+    '''
+    Return the version and uuid of the cluster state, both change with every
+    update of the indices, templates, ILM policies or pipelines.
+    '''
+    response = response_body(client.cluster.state(metric='version', filter_path='version,state_uuid'))
+    return [response.get('version'), response.get('state_uuid')]
+
+
+class ClusterCache():
+    """
+    Snapshot of the cluster metadata stored on disk. A section is fetched the
+    first time it is needed and reused until the TTL expires or the cluster
+    state version changes.
+
+    """
+    def __init__(self, path, ttl):
+        self.path = path
+        self.ttl = ttl
+        self.data = None
+
+    def load(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return None
+
+    def save(self):
+        try:
+            os.makedirs(CACHE_DIR, 0o700)
+        except OSError as excep:
+            if excep.errno != errno.EEXIST:
+                raise
+        tmp_file = "{0}.{1}.tmp".format(self.path, os.getpid())
+        fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as f:
+            json.dump(self.data, f)
+        os.rename(tmp_file, self.path)
+
+    def validate(self, client):
+        '''
+        Load the cache, discarding it when it has expired or the cluster state has changed since it was written
+        '''
+        version = state_version(client)
+        data = self.load()
+        if data is None or time.time() - data['created'] > self.ttl or data['version'] != version:
+            data = {"created": time.time(), "version": version, "sections": {}}
+        self.data = data
+
+    def section(self, client, name):
+        '''
+        Return every object of the section, fetching them from the cluster when they are not cached
+        '''
+        if self.data is None:
+            self.validate(client)
+        if name not in self.data['sections']:
+            self.data['sections'][name] = SECTIONS[name](client)
+            self.save()
+        return self.data['sections'][name]
+
+    def entries(self, client, name, keys):
+        '''
+        Return the requested objects of the section, fetching the ones that are not cached from the cluster
+        '''
+        if self.data is None:
+            self.validate(client)
+        entries = self.data['sections'].setdefault(name, {})
+        missing = [key for key in keys if key not in entries]
+        if missing:
+            entries.update(ENTRIES[name](client, missing))
+            self.save()
+        return dict((key, entries[key]) for key in keys if key in entries)
+
+    def invalidate(self):
+        self.data = None
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+
+_caches = {}
+
+
+def cluster_cache(hosts, user, ttl):
+    '''
+    Return the cache of the cluster, shared by all the clients of the module
+    '''
+    path = os.path.join(CACHE_DIR, cache_key(hosts, user) + '.json')
+    if path not in _caches:
+        _caches[path] = ClusterCache(path, ttl)
+    return _caches[path]
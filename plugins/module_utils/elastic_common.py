@@ -2,24 +2,83 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 from ansible.module_utils.basic import AnsibleModule, missing_required_lib  # pylint: disable=unused-import
 
-import traceback
+import importlib
+import json
+import random
+import re
+import threading
+import time
 
+# The elasticsearch library and its transport stack are only imported when
+# they are first used, usually when a client is built in connect(), so
+# modules exiting before that don't pay for the import.
 elastic_found = False
 E_IMP_ERR = None
-NotFoundError = None
-helpers = None
-__version__ = None
 
 try:
-    from elasticsearch import Elasticsearch
-    from elasticsearch.exceptions import NotFoundError  # pylint: disable=unused-import
-    from elasticsearch import helpers  # pylint: disable=unused-import
-    from elasticsearch import __version__  # pylint: disable=unused-import
+    from importlib.util import find_spec
+    elastic_found = find_spec('elasticsearch') is not None
+except ImportError:  # Python 2
+    import imp
+    try:
+        imp.find_module('elasticsearch')
+        elastic_found = True
+    except ImportError:
+        elastic_found = False
 
-    elastic_found = True
-except ImportError:
-    E_IMP_ERR = traceback.format_exc()
-    elastic_found = False
+if not elastic_found:
+    E_IMP_ERR = "No module named 'elasticsearch'"
+
+
+class LazyModule():
+    """
+    Imports the named module on first attribute access
+
+    """
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        return getattr(importlib.import_module(self._name), attr)
+
+
+class LazyVersion():
+    """
+    The version tuple of the elasticsearch library, imported on first comparison
+
+    """
+    def _version(self):
+        return importlib.import_module('elasticsearch').__version__
+
+    def __lt__(self, other):
+        return self._version() < other
+
+    def __le__(self, other):
+        return self._version() <= other
+
+    def __eq__(self, other):
+        return self._version() == other
+
+    def __ne__(self, other):
+        return self._version() != other
+
+    def __gt__(self, other):
+        return self._version() > other
+
+    def __ge__(self, other):
+        return self._version() >= other
+
+    def __getitem__(self, index):
+        return self._version()[index]
+
+    def __repr__(self):
+        return repr(self._version())
+
+
+elasticsearch = LazyModule('elasticsearch')
+elastic_exceptions = LazyModule('elasticsearch.exceptions')
+helpers = LazyModule('elasticsearch.helpers')
+__version__ = LazyVersion()
 
 
 def elastic_common_argument_spec():
@@ -30,16 +89,462 @@ def elastic_common_argument_spec():
         auth_method=dict(type='str', choices=['', 'http_auth'], default=''),
         auth_scheme=dict(type='str', choices=['http', 'https'], default='http'),
         cafile=dict(type='str', default=None),
+        capath=dict(type='str', default=None),
+        client_cert=dict(type='str', default=None),
+        client_key=dict(type='str', default=None, no_log=False),
+        ssl_verify_mode=dict(type='str', choices=['full', 'certificate', 'none'], default='full'),
         connection_options=dict(type='list', elements='dict', default=[]),
         login_user=dict(type='str', required=False),
         login_password=dict(type='str', required=False, no_log=True),
         login_hosts=dict(type='list', elements='str', required=False, default=['localhost']),
         login_port=dict(type='int', required=False, default=9200),
         timeout=dict(type='int', default=30),
+        pool_maxsize=dict(type='int'),
+        sniff_on_start=dict(type='bool', default=False),
+        sniff_on_connection_fail=dict(type='bool', default=False),
+        sniffer_timeout=dict(type='int'),
+        retry_on_timeout=dict(type='bool', default=False),
+        retries=dict(type='int', default=0),
+        retry_on_status=dict(type='list', elements='int', default=[429, 502, 503, 504]),
+        retry_max_delay=dict(type='int', default=30),
+        async_requests=dict(type='bool', default=False),
+        trace=dict(type='bool', default=False),
+        trace_file=dict(type='path'),
+        cache=dict(type='bool', default=False),
+        cache_ttl=dict(type='int', default=300),
+        broker=dict(type='bool', default=False),
+        broker_idle_timeout=dict(type='int', default=300),
+        broker_read_timeout=dict(type='int', default=120),
     )
     return options
 
 
+def elastic_clusters_argument_spec():
+    """
+    Returns a dict containing the options of the modules running against several clusters with ElasticHelpers.run()
+    """
+    options = dict(
+        clusters=dict(type='list', elements='dict', options=dict(
+            name=dict(type='str', required=True),
+            login_hosts=dict(type='list', elements='str'),
+            login_port=dict(type='int'),
+            auth_method=dict(type='str', choices=['', 'http_auth']),
+            auth_scheme=dict(type='str', choices=['http', 'https']),
+            login_user=dict(type='str'),
+            login_password=dict(type='str', no_log=True),
+            cafile=dict(type='str'),
+            capath=dict(type='str'),
+            client_cert=dict(type='str'),
+            client_key=dict(type='str', no_log=False),
+            ssl_verify_mode=dict(type='str', choices=['full', 'certificate', 'none']),
+            connection_options=dict(type='list', elements='dict'),
+        )),
+        cluster_concurrency=dict(type='int', default=10),
+    )
+    return options
+
+
+def cluster_health(client, request_timeout, **params):
+    '''
+    Call the cluster health endpoint. A 408 status is returned by Elasticsearch
+    when a wait_for_* condition is not met before the server side timeout.
+    The body still contains the health document so we don't raise on it.
+    '''
+    if __version__ >= (8, 0, 0):
+        return client.options(request_timeout=request_timeout, ignore_status=408).cluster.health(**params)
+    else:
+        return client.cluster.health(request_timeout=request_timeout, ignore=408, **params)
+
+
+def backoff_delay(attempt, cap):
+    '''
+    Return a jittered exponential backoff delay in seconds, capped at cap
+    '''
+    delay = min(cap, 2 ** (attempt - 1))
+    return random.uniform(delay / 2.0, delay)
+
+
+def wait_for_health(client, interval, request_timeout, wait_timeout, **params):
+    '''
+    Wait for the cluster health conditions in params, such as wait_for_status,
+    to be met using server side waits of at most interval seconds
+    '''
+    start = time.time()
+    attempt = 0
+    while time.time() - start < wait_timeout:
+        attempt += 1
+        call_start = time.time()
+        remaining = min(interval, max(0, int(wait_timeout - (time.time() - start))))
+        try:
+            health = cluster_health(client,
+                                    remaining + request_timeout,
+                                    timeout="{0}s".format(remaining),
+                                    **params)
+            if not health['timed_out']:
+                return True
+        except Exception:
+            pass
+        delay = backoff_delay(attempt, interval) - (time.time() - call_start)
+        delay = min(delay, wait_timeout - (time.time() - start))
+        if delay > 0:
+            time.sleep(delay)
+    return False
+
+
+_ssl_contexts = {}
+
+
+def ssl_context(cafile=None, capath=None, client_cert=None, client_key=None, ssl_verify_mode='full'):
+    '''
+    Return an SSL context for the TLS options. Contexts are cached by their
+    options so the CA bundle and certificates are only loaded once per process.
+    '''
+    key = (cafile, capath, client_cert, client_key, ssl_verify_mode)
+    if key not in _ssl_contexts:
+        import ssl
+        context = ssl.create_default_context(cafile=cafile, capath=capath)
+        if ssl_verify_mode != 'full':
+            context.check_hostname = False
+        if ssl_verify_mode == 'none':
+            context.verify_mode = ssl.CERT_NONE
+        if client_cert is not None:
+            context.load_cert_chain(client_cert, client_key)
+        _ssl_contexts[key] = context
+    return _ssl_contexts[key]
+
+
+def timed(timings, phase, func, *args, **kwargs):
+    '''
+    Call func and record how long it took in ms under the phase key
+    '''
+    start = time.time()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        timings[phase] = int((time.time() - start) * 1000)
+
+
+BYTE_UNITS = {"b": 1, "kb": 1024, "mb": 1024 ** 2, "gb": 1024 ** 3, "tb": 1024 ** 4, "pb": 1024 ** 5}
+TIME_UNITS = {"nanos": 0.000001, "micros": 0.001, "ms": 1, "s": 1000, "m": 60000, "h": 3600000, "d": 86400000}
+VALUE_WITH_UNIT = re.compile(r'^(\d+(?:\.\d+)?)\s*([a-z]+)$')
+
+
+def canonical_value(value):
+    '''
+    Return the value in a form that can be compared with the values returned by the cluster.
+    The cluster returns settings as strings, so numbers and bools are compared as strings
+    and byte sizes and time values are converted to bytes and ms, so 1gb equals 1073741824b.
+    '''
+    if value is None:
+        return None
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (list, tuple)):
+        return [canonical_value(item) for item in value]
+    value = str(value).strip()
+    if value.lower() in ["true", "false"]:
+        return value.lower()
+    match = VALUE_WITH_UNIT.match(value.lower())
+    if match is not None:
+        number, unit = float(match.group(1)), match.group(2)
+        if unit in BYTE_UNITS:
+            return "{0}b".format(int(number * BYTE_UNITS[unit]))
+        if unit in TIME_UNITS:
+            return "{0}ms".format(number * TIME_UNITS[unit])
+    return value
+
+
+def same_value(desired, actual):
+    return actual is not None and canonical_value(desired) == canonical_value(actual)
+
+
+def size_in_bytes(value):
+    '''
+    Return a byte size such as 50gb, or a number of bytes, as a number of bytes
+    '''
+    match = re.match(r'^(\d+(?:\.\d+)?)\s*([a-z]*)$', str(value).strip().lower())
+    if match is None or match.group(2) not in BYTE_UNITS and match.group(2) != "":
+        raise ValueError("Invalid byte size: {0}".format(value))
+    return int(float(match.group(1)) * BYTE_UNITS.get(match.group(2), 1))
+
+
+def index_batches(names, max_length=3000):
+    '''
+    Split index names into comma separated lists short enough for the request line
+    '''
+    batches = []
+    batch = []
+    length = 0
+    for name in names:
+        if batch and length + len(name) + 1 > max_length:
+            batches.append(",".join(batch))
+            batch = []
+            length = 0
+        batch.append(name)
+        length += len(name) + 1
+    if batch:
+        batches.append(",".join(batch))
+    return batches
+
+
+def is_pattern(name):
+    '''
+    Return True when the name is a wildcard, exclusion, date math or _all expression instead of a name
+    '''
+    return name == '_all' or name.startswith(('-', '<')) or any(c in name for c in '*,')
+
+
+def join_filter_path(fields):
+    '''
+    Return the filter_path parameter selecting only the given response fields
+    '''
+    unique_fields = []
+    for field in fields:
+        if field not in unique_fields:
+            unique_fields.append(field)
+    return ",".join(unique_fields)
+
+
+def flatten_settings(settings, prefix=""):
+    '''
+    Return nested settings, as returned when flat_settings is false, as flat settings
+    '''
+    flat = {}
+    for key, value in settings.items():
+        if isinstance(value, dict):
+            flat.update(flatten_settings(value, prefix + key + "."))
+        else:
+            flat[prefix + key] = value
+    return flat
+
+
+def error_status(excep):
+    '''
+    Return the HTTP status of a client exception for both versions of the client
+    '''
+    meta = getattr(excep, 'meta', None)
+    status = getattr(meta, 'status', None)
+    if status is None:
+        status = getattr(excep, 'status_code', None)
+    return status
+
+
+def response_took(data):
+    '''
+    Return the took value, the time spent server side in ms, of a raw JSON response body or None
+    '''
+    if not data:
+        return None
+    if isinstance(data, bytes):
+        data = data.decode('utf-8', 'replace')
+    if not data.startswith('{'):
+        return None
+    try:
+        took = json.loads(data).get('took')
+    except ValueError:
+        return None
+    if isinstance(took, int):
+        return took
+    return None
+
+
+_trace_lock = threading.Lock()
+
+
+class RequestTrace():
+    """
+    Records the HTTP requests made by a client. The entries are kept for the
+    module result or, when a path is given, appended to that file as JSON lines.
+
+    """
+    def __init__(self, path=None):
+        self.path = path
+        self.entries = []
+
+    def record(self, method, path, status, body, data, rtt):
+        entry = {
+            "method": method,
+            "path": path,
+            "status": status,
+            "request_bytes": len(body) if body else 0,
+            "response_bytes": len(data) if data else 0,
+            "took": response_took(data),
+            "rtt": rtt
+        }
+        with _trace_lock:
+            if self.path is None:
+                self.entries.append(entry)
+            else:
+                with open(self.path, 'a') as f:
+                    f.write(json.dumps(entry, sort_keys=True) + "\n")
+
+    def traced_class(self):
+        '''
+        Return a connection class (7.x) or node class (8.x) recording each request it performs
+        '''
+        trace = self
+        if __version__ >= (8, 0, 0):
+            base = importlib.import_module('elastic_transport').Urllib3HttpNode
+
+            class TracedNode(base):
+                def perform_request(self, method, target, body=None, *args, **kwargs):
+                    start = time.time()
+                    status = None
+                    data = None
+                    try:
+                        response = super(TracedNode, self).perform_request(method, target, body, *args, **kwargs)
+                        status = response.meta.status
+                        data = response.body
+                        return response
+                    finally:
+                        trace.record(method, target, status, body, data, int((time.time() - start) * 1000))
+
+            return TracedNode
+
+        base = elasticsearch.Urllib3HttpConnection
+
+        class TracedConnection(base):
+            def perform_request(self, method, url, params=None, body=None, *args, **kwargs):
+                start = time.time()
+                status = None
+                data = None
+                try:
+                    status, headers, data = super(TracedConnection, self).perform_request(method, url, params, body, *args, **kwargs)
+                    return status, headers, data
+                except Exception as excep:
+                    status = error_status(excep)
+                    raise
+                finally:
+                    path = url
+                    if params:
+                        path = "{0}?{1}".format(url, "&".join("{0}={1}".format(k, v) for k, v in sorted(params.items())))
+                    trace.record(method, path, status, body, data, int((time.time() - start) * 1000))
+
+        return TracedConnection
+
+
+def host_urls(params):
+    '''
+    Return the URLs of the hosts given by the module parameters
+    '''
+    return ["{0}://{1}:{2}/".format(params['auth_scheme'], host, params['login_port'])
+            for host in params['login_hosts']]
+
+
+def local_cache(params):
+    from ansible_collections.community.elastic.plugins.module_utils.elastic_cache import cluster_cache
+    return cluster_cache(host_urls(params), params['login_user'], params['cache_ttl'])
+
+
+def cached(module, client, section, names=None):
+    '''
+    Return every object of a section, such as roles, from the local cluster state cache.
+    Sections cached per object, such as indices, return only the objects in names.
+    Returns None when the cache is disabled or the section can't be fetched, the caller
+    then requests the object from the cluster.
+    '''
+    if not module.params.get('cache'):
+        return None
+    try:
+        if names is not None:
+            return local_cache(module.params).entries(client, section, names)
+        return local_cache(module.params).section(client, section)
+    except Exception:
+        return None
+
+
+class ClusterResult(BaseException):
+    """
+    Raised by ClusterModule in place of exiting the module. Derives from
+    BaseException, like the SystemExit raised by AnsibleModule, so the result
+    passes through the exception handlers of the operation.
+
+    """
+    def __init__(self, result):
+        super(ClusterResult, self).__init__()
+        self.result = result
+
+
+class ClusterModule():
+    """
+    Stands in for the AnsibleModule while an operation runs against one of the
+    clusters. The connection parameters are those of the cluster, exit_json and
+    fail_json end the operation with the result for the cluster.
+
+    """
+    def __init__(self, module, params):
+        self.module = module
+        self.params = params
+
+    def __getattr__(self, attr):
+        return getattr(self.module, attr)
+
+    def exit_json(self, **kwargs):
+        raise ClusterResult(kwargs)
+
+    def fail_json(self, msg, **kwargs):
+        kwargs['failed'] = True
+        kwargs['msg'] = msg
+        raise ClusterResult(kwargs)
+
+
+# Calls that can be sent again without repeating a write. Other calls, such as
+# index, bulk, reindex, rollover or scroll, are never retried.
+IDEMPOTENT_NAMESPACES = ['cat', 'nodes']
+IDEMPOTENT_METHODS = re.compile(r'^(get|exists|search|count|mget|msearch|info|ping|health|stats|state|put_|refresh|flush)|^delete(_(?!by_query).*)?$')
+
+
+class RetryingClient():
+    """
+    Wraps an Elasticsearch client, or one of its namespaces, and retries
+    idempotent calls that fail with a transient error after a jittered
+    exponential backoff. The client connection pool sends the retried request
+    to the next host, its own retries are disabled by connect().
+
+    """
+    def __init__(self, client, retries, retry_on_status, retry_on_timeout, retry_max_delay, namespace=None):
+        self._client = client
+        self._policy = (retries, retry_on_status, retry_on_timeout, retry_max_delay)
+        self._namespace = namespace
+
+    def _idempotent(self, name):
+        return self._namespace in IDEMPOTENT_NAMESPACES or IDEMPOTENT_METHODS.match(name) is not None
+
+    def _retryable(self, excep):
+        retries, retry_on_status, retry_on_timeout, retry_max_delay = self._policy
+        if isinstance(excep, elastic_exceptions.ConnectionTimeout):
+            return retry_on_timeout
+        if isinstance(excep, elastic_exceptions.ConnectionError):
+            return True
+        return error_status(excep) in retry_on_status
+
+    def _wrap(self, value, namespace=None):
+        if isinstance(value, elasticsearch.Elasticsearch) or \
+                (not callable(value) and type(value).__name__.endswith('Client')):
+            return RetryingClient(value, *self._policy, namespace=namespace)
+        return value
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr) or isinstance(attr, type):
+            return self._wrap(attr, name)
+        if not self._idempotent(name):
+            return attr
+
+        def call_with_retries(*args, **kwargs):
+            retries = self._policy[0]
+            attempt = 0
+            while True:
+                try:
+                    return self._wrap(attr(*args, **kwargs))
+                except Exception as excep:
+                    attempt += 1
+                    if attempt > retries or not self._retryable(excep):
+                        raise
+                    time.sleep(backoff_delay(attempt, self._policy[3]))
+        return call_with_retries
+
+
 class ElasticHelpers():
     """
     Class containing helper functions for Elasticsearch modules
@@ -47,6 +552,35 @@ class ElasticHelpers():
     """
     def __init__(self, module):
         self.module = module
+        self.trace = None
+        if module.params.get('trace'):
+            self.trace = RequestTrace(module.params['trace_file'])
+            if module.params['trace_file'] is None:
+                module.exit_json = self.with_trace(module.exit_json)
+                module.fail_json = self.with_trace(module.fail_json)
+        if module.params.get('cache'):
+            module.exit_json = self.invalidating_cache(module.exit_json, False)
+            module.fail_json = self.invalidating_cache(module.fail_json, True)
+
+    def with_trace(self, result_func):
+        '''
+        Add the recorded requests to the result returned by result_func
+        '''
+        def wrapper(*args, **kwargs):
+            kwargs['trace'] = self.trace.entries
+            return result_func(*args, **kwargs)
+        return wrapper
+
+    def invalidating_cache(self, result_func, always):
+        '''
+        Discard the local cluster state cache before returning a result that changed the
+        cluster or, when always is true, any result such as a failure after a partial change
+        '''
+        def wrapper(*args, **kwargs):
+            if always or (kwargs.get('changed') and not self.module.check_mode):
+                local_cache(self.module.params).invalidate()
+            return result_func(*args, **kwargs)
+        return wrapper
 
     def build_auth(self, module):
         '''
@@ -57,42 +591,302 @@ class ElasticHelpers():
             if module.params['auth_method'] == 'http_auth':
                 auth["http_auth"] = (module.params['login_user'],
                                      module.params['login_password'])
-
-                if module.params['cafile'] is not None:
-                    from ssl import create_default_context
-                    context = create_default_context(module.params['cafile'])
-                    auth["ssl_context"] = context
             else:
                 module.fail_json("Invalid or unsupported auth_method provided")
+        if module.params['auth_scheme'] == 'https':
+            auth.update(self.tls_arguments())
         return auth
 
-    def connect(self):
+    def tls_arguments(self):
+        '''
+        Return the client arguments for the TLS options. An SSL context is only
+        used to verify certificates in full as the clients reset its verify mode
+        and check the hostname themselves, the other modes use client arguments.
+        '''
+        params = self.module.params
+        mode = params['ssl_verify_mode']
+        if mode == 'full':
+            if any(params[option] is not None for option in ['cafile', 'capath', 'client_cert', 'client_key']):
+                return {"ssl_context": ssl_context(**self.tls_options())}
+            return {}
+        if mode == 'certificate' and params['capath'] is not None:
+            self.module.fail_json(msg="capath can't be used with ssl_verify_mode=certificate, use cafile instead.")
+        arguments = dict((argument, params[option])
+                         for option, argument in [('cafile', 'ca_certs'), ('client_cert', 'client_cert'), ('client_key', 'client_key')]
+                         if params[option] is not None)
+        if mode == 'none':
+            arguments['verify_certs'] = False
+        else:
+            arguments['verify_certs'] = True
+            arguments['ssl_assert_hostname'] = False
+        return arguments
+
+    def tls_options(self):
+        '''
+        Return the TLS options used to build the SSL context
+        '''
+        return dict((option, self.module.params[option])
+                    for option in ['cafile', 'capath', 'client_cert', 'client_key', 'ssl_verify_mode'])
+
+    def connection_options(self):
+        '''
+        Merge the connection_options dicts into a single dict of client arguments
+        '''
+        options = {}
+        for option in self.module.params['connection_options']:
+            options.update(option)
+        return options
+
+    def pool_options(self):
+        '''
+        Build the connection pool, sniffing and retry arguments for the
+        installed version of the client
+        '''
+        params = self.module.params
+        options = {}
+        if params['retry_on_timeout']:
+            options['retry_on_timeout'] = True
+        if params['retries'] > 0:
+            # RetryingClient retries instead of the transport
+            options['max_retries'] = 0
+        if __version__ >= (8, 0, 0):
+            if params['pool_maxsize'] is not None:
+                options['connections_per_node'] = params['pool_maxsize']
+            if params['sniff_on_start']:
+                options['sniff_on_start'] = True
+            if params['sniff_on_connection_fail']:
+                options['sniff_on_node_failure'] = True
+            if params['sniffer_timeout'] is not None:
+                options['sniff_before_requests'] = True
+                options['min_delay_between_sniffing'] = params['sniffer_timeout']
+        else:
+            if params['pool_maxsize'] is not None:
+                options['maxsize'] = params['pool_maxsize']
+            if params['sniff_on_start']:
+                options['sniff_on_start'] = True
+            if params['sniff_on_connection_fail']:
+                options['sniff_on_connection_fail'] = True
+            if params['sniffer_timeout'] is not None:
+                options['sniffer_timeout'] = params['sniffer_timeout']
+        return options
+
+    def run(self, operation):
+        '''
+        Connect and call operation(module, client), which ends by calling module.exit_json
+        or module.fail_json. When clusters is set the operation runs concurrently against
+        each of the clusters and the module returns the result of each one in clusters.
+        '''
+        clusters = self.module.params.get('clusters')
+        if not clusters:
+            return operation(self.module, self.connect())
+
+        def run_on_cluster(cluster):
+            params = dict(self.module.params)
+            params.update((k, v) for k, v in cluster.items() if v is not None and k != 'name')
+            params['clusters'] = None
+            module = ClusterModule(self.module, params)
+            try:
+                operation(module, ElasticHelpers(module).connect())
+                result = dict(changed=False)
+            except ClusterResult as excep:
+                result = excep.result
+            except Exception as excep:
+                result = dict(failed=True, changed=False, msg='Elastic error: {0}'.format(excep))
+            result['cluster'] = cluster['name']
+            return result
+
+        from multiprocessing.pool import ThreadPool
+        pool = ThreadPool(min(len(clusters), self.module.params['cluster_concurrency']))
+        try:
+            results = pool.map(run_on_cluster, clusters)
+        finally:
+            pool.close()
+        changed = any(result.get('changed', False) for result in results)
+        failed = [result['cluster'] for result in results if result.get('failed', False)]
+        if failed:
+            self.module.fail_json(msg="The operation failed on the clusters {0}.".format(", ".join(failed)),
+                                  changed=changed,
+                                  clusters=results)
+        changed_clusters = [result['cluster'] for result in results if result.get('changed', False)]
+        self.module.exit_json(msg="The operation succeeded on {0} clusters, {1} changed.".format(len(results), len(changed_clusters)),
+                              changed=changed,
+                              clusters=results)
+
+    def client_arguments(self):
+        '''
+        Return the hosts and keyword arguments used to build a client
+        '''
         auth = self.build_auth(self.module)
-        hosts = list(map(lambda host: "{0}://{1}:{2}/".format(self.module.params['auth_scheme'],
-                                                              host,
-                                                              self.module.params['login_port']),
-                         self.module.params['login_hosts']))
-        elastic = Elasticsearch(hosts,
-                                timeout=self.module.params['timeout'],
-                                *self.module.params['connection_options'],
-                                **auth)
-        return elastic
+        hosts = host_urls(self.module.params)
+        if self.module.params['broker']:
+            return self.broker_arguments(hosts, auth)
+        options = self.pool_options()
+        options.update(self.connection_options())
+        options.update(auth)
+        options['timeout'] = self.module.params['timeout']
+        return hosts, options
+
+    def connect(self):
+        hosts, options = self.client_arguments()
+        if self.trace is not None:
+            if __version__ >= (8, 0, 0):
+                options['node_class'] = self.trace.traced_class()
+            else:
+                options['connection_class'] = self.trace.traced_class()
+        elastic = elasticsearch.Elasticsearch(hosts, **options)
+        return self.with_retries(elastic)
+
+    def with_retries(self, client):
+        '''
+        Wrap the client with the retry policy when retries are enabled
+        '''
+        if self.module.params['retries'] > 0:
+            return RetryingClient(client,
+                                  self.module.params['retries'],
+                                  self.module.params['retry_on_status'],
+                                  self.module.params['retry_on_timeout'],
+                                  self.module.params['retry_max_delay'])
+        return client
+
+    def broker_arguments(self, hosts, auth):
+        '''
+        Return the client arguments to connect through a local broker process
+        that keeps the connections to the cluster open between module executions.
+        '''
+        from ansible_collections.community.elastic.plugins.module_utils.elastic_broker import (
+            ensure_broker,
+            TOKEN_HEADER
+        )
+        state = ensure_broker(hosts,
+                              self.tls_options(),
+                              self.module.params['broker_idle_timeout'],
+                              self.module.params['pool_maxsize'] or 10,
+                              self.module.params['broker_read_timeout'])
+        # The broker listens on plain http and verifies the cluster certificates itself
+        for argument in self.tls_arguments():
+            auth.pop(argument, None)
+        # Sniffing would bypass the broker and the pool size applies to the broker
+        # connections, so only the retry option is kept
+        options = {}
+        if self.module.params['retry_on_timeout']:
+            options['retry_on_timeout'] = True
+        if self.module.params['retries'] > 0:
+            options['max_retries'] = 0
+        options.update(self.connection_options())
+        options.update(auth)
+        options['timeout'] = self.module.params['timeout']
+        options['headers'] = {TOKEN_HEADER: state['token']}
+        return ["http://127.0.0.1:{0}/".format(state['port'])], options
+
+    def async_available(self):
+        '''
+        Return true if async requests were requested and the async client can be used.
+        Traced tasks issue their requests one after another so every request is recorded.
+        '''
+        if not self.module.params['async_requests'] or self.trace is not None:
+            return False
+        try:
+            from importlib.util import find_spec
+        except ImportError:  # Python 2
+            return False
+        return find_spec('aiohttp') is not None
+
+    def connect_async(self):
+        '''
+        Build an AsyncElasticsearch client together with the event loop used
+        by run_concurrently(). Release both with close_async().
+        The retry policy is not applied to the async client.
+        '''
+        import asyncio
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        hosts, options = self.client_arguments()
+        return elasticsearch.AsyncElasticsearch(hosts, **options)
+
+    def run_concurrently(self, calls):
+        '''
+        Run the calls, callables returning an awaitable such as
+        lambda: client.indices.create(index=name), on the event loop of connect_async().
+        At most pool_maxsize calls, 10 by default, run at the same time.
+        Returns the results in order. A call raising an exception has the
+        exception in place of its result.
+        '''
+        import asyncio
+        limit = self.module.params['pool_maxsize'] or 10
+        results = []
+        for start in range(0, len(calls), limit):
+            future = asyncio.gather(*[call() for call in calls[start:start + limit]], return_exceptions=True)
+            results.extend(self.loop.run_until_complete(future))
+        return results
+
+    def close_async(self, client):
+        import asyncio
+        try:
+            self.loop.run_until_complete(client.close())
+        finally:
+            self.loop.close()
+            asyncio.set_event_loop(None)
 
     def query(self, client, index, query):
         response = client.search(index=index, body=query)
         return response
 
+    def existing_indices(self, client, names, ignore_missing=True):
+        '''
+        Return the sorted names of the indexes matching the given names, aliases or patterns.
+        All the names are checked with a single request unless they don't fit on one request line.
+        Raises NotFoundError if ignore_missing is false and one of the names does not exist.
+        '''
+        params = dict(name='index.uuid',
+                      filter_path='*.settings.index.uuid',
+                      expand_wildcards='open,closed')
+        if ignore_missing:
+            params['ignore_unavailable'] = True
+        indices = set()
+        for batch in index_batches(names):
+            indices.update(dict(client.indices.get_settings(index=batch, **params)).keys())
+        return sorted(indices)
+
+    def existing_aliases(self, client, names):
+        '''
+        Return the names that are aliases. Only the names that are not patterns are checked,
+        with a single request unless they don't fit on one request line.
+        A 404 lists the aliases that exist next to the error about the missing ones.
+        '''
+        names = [name for name in names if not is_pattern(name)]
+        aliases = set()
+        for batch in index_batches(names):
+            if __version__ >= (8, 0, 0):
+                response = client.options(ignore_status=404).indices.get_alias(name=batch)
+            else:
+                response = client.indices.get_alias(name=batch, ignore=404)
+            for entry in dict(response).values():
+                if isinstance(entry, dict):
+                    aliases.update(entry.get('aliases', {}))
+        return [name for name in names if name in aliases]
+
     def index_dynamic_method(self, module, client, method, name):
         '''
         This method is here so we don't have to dulicate loads of code.
         It's only really for very simple methods where we only pass the index name
         @client - ES connection
         @method - The indicies method to call
-        @name - The index name.
+        @name - The index name, or a list of index names, aliases and patterns.
+        The indexes are resolved with a single request and the method is called
+        once per batch of index names.
         '''
-        if not client.indices.exists(index=name):
+        names = name if isinstance(name, list) else [name]
+        try:
+            indices = self.existing_indices(client, names, ignore_missing=False)
+        except elastic_exceptions.NotFoundError:
+            indices = []
+        if not indices:
             module.fail_json(msg='Cannot perform {0} action on an index that does not exist'.format(method))
         else:
             class_method = getattr(client.indices, method)
-            response = class_method(index=name)
-            module.exit_json(changed=True, msg="The '{0}' action was performed on the index '{1}'.".format(method, name), **response)
+            responses = [dict(class_method(index=batch)) for batch in index_batches(indices)]
+            response = responses[0] if len(responses) == 1 else {"responses": responses}
+            module.exit_json(changed=True,
+                             msg="The '{0}' action was performed on the index '{1}'.".format(method, ",".join(names)),
+                             indices=indices,
+                             **response)
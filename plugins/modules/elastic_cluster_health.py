@@ -51,9 +51,27 @@ options:
     default: 3
   interval:
     description:
-      - The number of seconds to wait between polling executions.
+      - The maximum number of seconds to wait for each polling execution.
+      - Elasticsearch holds each request for up to this long waiting for I(status), I(wait_for_nodes)
+        and I(wait_for_no_relocating_shards), so convergence is detected as soon as it happens.
+      - Requests that return early without converging are followed by a jittered exponential backoff capped at this value.
     type: int
     default: 10
+  deadline:
+    description:
+      - The maximum number of seconds to spend waiting for the cluster to converge.
+      - Polling stops at the deadline even if I(poll) has not been reached.
+    type: int
+  wait_for_nodes:
+    description:
+      - Wait until the specified number of nodes is available.
+      - Accepts C(N), C(>=N), C(<=N), C(>N) and C(<N).
+    type: str
+  wait_for_no_relocating_shards:
+    description:
+      - Wait until there are no relocating shards in the cluster.
+    type: bool
+    default: false
   wait_for:
     description:
       - Wait for the specific variable to reach a specific figure.
@@ -78,7 +96,81 @@ options:
     description:
       - Used in conjunction with wait_for.
       - Expected value of the wait_for variable
+      - May be prefixed with one of the operators C(==), C(!=), C(>=), C(<=), C(>) or C(<), i.e. C(>=3).
     type: str
+  conditions:
+    description:
+      - A list of conditions that must all be met by the same cluster health response.
+      - Evaluated in addition to I(status) and I(wait_for).
+      - For the status field the comparison follows green > yellow > red.
+    type: list
+    elements: dict
+    suboptions:
+      index:
+        description:
+          - Evaluate the condition against the health of this index rather than the cluster.
+          - The request is made with at least I(level=indices) when set.
+          - With the default I(level=cluster) and no I(filter_path) only the condition fields of the
+            condition indices are returned under C(indices).
+        type: str
+      field:
+        description:
+          - The name of the variable returned by cluster health API.
+          - C(number_of_shards) and C(number_of_replicas) are only available for index conditions.
+        type: str
+        required: true
+        choices:
+          - number_of_shards
+          - number_of_replicas
+          - status
+          - number_of_nodes
+          - number_of_data_nodes
+          - active_primary_shards
+          - active_shards
+          - relocating_shards
+          - initializing_shards
+          - unassigned_shards
+          - delayed_unassigned_shards
+          - number_of_pending_tasks
+          - number_of_in_flight_fetch
+          - task_max_waiting_in_queue_millis
+          - active_shards_percent_as_number
+      operator:
+        description:
+          - The comparison operator.
+        type: str
+        choices:
+          - '=='
+          - '!='
+          - '>='
+          - '<='
+          - '>'
+          - '<'
+        default: '=='
+      value:
+        description:
+          - The value to compare the variable against.
+        type: str
+        required: true
+  indices:
+    description:
+      - Limit the health request to these indices, index patterns or aliases.
+      - I(status) and the cluster level variables then only reflect these indices.
+    type: list
+    elements: str
+  filter_path:
+    description:
+      - Only return these fields of the health response, i.e. C(status) or C(indices.*.status).
+      - Keeps polling payloads and the module result small on clusters with many indices or shards.
+      - The fields required by I(status), I(wait_for) and I(conditions) are always included.
+    type: list
+    elements: str
+  record_samples:
+    description:
+      - Record the shard and pending task counts of every polling execution.
+      - The samples are returned in I(samples) together with convergence metrics in I(convergence).
+    type: bool
+    default: false
   status:
     description:
       - Expected status of the cluster changes to the one provided or better, i.e. green > yellow > red.
@@ -94,18 +186,116 @@ EXAMPLES = r'''
 - name: Validate cluster health
   community.elastic.elastic_cluster_health:
 
-- name: Ensure cluster health status is green with 90 seconds timeout
+- name: Ensure cluster health status is green with 90 seconds deadline
   community.elastic.elastic_cluster_health:
-    wait_for_status: "green"
-    timeout: 90
+    status: "green"
+    deadline: 90
 
-- name: Ensure at least 10 nodes are up with 2m timeout
+- name: Ensure at least 10 nodes are up with 2m deadline
   community.elastic.elastic_cluster_health:
     wait_for_nodes: ">=10"
-    timeout: 2m
+    poll: 10
+    interval: 30
+    deadline: 120
+
+- name: Wait for shard relocation to finish
+  community.elastic.elastic_cluster_health:
+    status: yellow
+    wait_for_no_relocating_shards: yes
+
+- name: Wait for at least 3 data nodes and no unassigned shards
+  community.elastic.elastic_cluster_health:
+    conditions:
+      - field: number_of_data_nodes
+        operator: ">="
+        value: 3
+      - field: unassigned_shards
+        value: 0
+
+- name: Wait for at least 3 nodes using wait_for
+  community.elastic.elastic_cluster_health:
+    wait_for: number_of_nodes
+    to_be: ">=3"
+
+- name: Wait for two indices to be green without downloading the health of every index
+  community.elastic.elastic_cluster_health:
+    indices:
+      - logs-2023.01.01
+      - logs-2023.01.02
+    filter_path:
+      - status
+      - indices.*.status
+
+- name: Wait for a single index to have no unassigned shards
+  community.elastic.elastic_cluster_health:
+    status: yellow
+    filter_path:
+      - status
+    conditions:
+      - index: myindex
+        field: unassigned_shards
+        value: 0
+
+- name: Record recovery progress while waiting for green
+  community.elastic.elastic_cluster_health:
+    poll: 60
+    interval: 10
+    record_samples: yes
+  register: health
+
+- name: Show the estimated time to green
+  debug:
+    msg: "{{ health.convergence.estimated_time_to_green }}"
 '''
 
 RETURN = r'''
+samples:
+  description: The shard and pending task counts of every polling execution.
+  returned: when record_samples is true
+  type: list
+  elements: dict
+  contains:
+    timestamp:
+      description: The time the response was received in seconds since the epoch.
+      type: float
+    status:
+      description: The cluster status.
+      type: str
+    unassigned_shards:
+      description: The number of unassigned shards.
+      type: int
+    initializing_shards:
+      description: The number of initializing shards.
+      type: int
+    relocating_shards:
+      description: The number of relocating shards.
+      type: int
+    number_of_pending_tasks:
+      description: The number of pending cluster tasks.
+      type: int
+convergence:
+  description: Metrics computed from the recorded samples.
+  returned: when record_samples is true
+  type: dict
+  contains:
+    duration:
+      description: Seconds between the first and last sample.
+      type: float
+    start_pending_shards:
+      description: Unassigned and initializing shards in the first sample.
+      type: int
+    end_pending_shards:
+      description: Unassigned and initializing shards in the last sample.
+      type: int
+    recovery_rate:
+      description: Shards recovered per second between the first and last sample.
+      type: float
+    estimated_time_to_green:
+      description: Seconds until no shards are pending at the current recovery rate. Null when the rate is not positive.
+      type: float
+    stalled:
+      description: True when shards are pending and no progress was made across the samples.
+      type: bool
 '''
 
 
@@ -118,22 +308,38 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     elastic_found,
     E_IMP_ERR,
     elastic_common_argument_spec,
-    ElasticHelpers
+    ElasticHelpers,
+    cluster_health,
+    join_filter_path,
+    backoff_delay
 )
+import operator
+import re
 import time
 
 
+OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '>': operator.gt,
+    '<': operator.lt
+}
+
+STATUS_ORDER = {
+    "red": 0,
+    "yellow": 1,
+    "green": 2
+}
+
+
 def elastic_status(desired_status, cluster_status):
     '''
     Return true if the desired status is equal to or less
     than the cluster status.
     '''
-    status_dict = {
-        "red": 0,
-        "yellow": 1,
-        "green": 2
-    }
-    if status_dict[desired_status] <= status_dict[cluster_status]:
+    if STATUS_ORDER[desired_status] <= STATUS_ORDER[cluster_status]:
         return True
     else:
         return False
@@ -141,15 +347,125 @@ def elastic_status(desired_status, cluster_status):
 
 def cast_to_be(to_be):
     '''
-    Cast the value to int if possible. Otherwise return the str value
+    Cast the value to int or float if possible. Otherwise return the str value
     '''
-    try:
-        to_be = int(to_be)
-    except ValueError:
-        pass
+    for cast in (int, float):
+        try:
+            return cast(to_be)
+        except ValueError:
+            pass
     return to_be
 
 
+def parse_to_be(to_be):
+    '''
+    Split an optional leading operator from the to_be value.
+    Returns a tuple of (operator, value)
+    '''
+    match = re.match(r'^\s*(==|!=|>=|<=|>|<)?\s*(.*?)\s*$', to_be)
+    return match.group(1) or '==', match.group(2)
+
+
+def condition_met(health_data, condition):
+    '''
+    Return true if the health response satisfies the condition
+    '''
+    if condition.get('index') is not None:
+        health_data = health_data.get('indices', {}).get(condition['index'], {})
+    actual = health_data.get(condition['field'])
+    expected = cast_to_be(condition['value'])
+    if condition['field'] == 'status':
+        if actual not in STATUS_ORDER or expected not in STATUS_ORDER:
+            return False
+        actual = STATUS_ORDER[actual]
+        expected = STATUS_ORDER[expected]
+    try:
+        return OPERATORS[condition['operator']](actual, expected)
+    except TypeError:
+        return False
+
+
+def format_condition(condition):
+    field = condition['field']
+    if condition.get('index') is not None:
+        field = "{0}.{1}".format(condition['index'], field)
+    return "{0} {1} {2}".format(field, condition['operator'], condition['value'])
+
+
+SAMPLE_FIELDS = [
+    'status',
+    'unassigned_shards',
+    'initializing_shards',
+    'relocating_shards',
+    'number_of_pending_tasks'
+]
+
+
+def health_sample(health_data, timestamp):
+    '''
+    Return the fields of the health response recorded for each poll
+    '''
+    sample = dict((field, health_data.get(field)) for field in SAMPLE_FIELDS)
+    sample['timestamp'] = timestamp
+    return sample
+
+
+def pending_shards(sample):
+    return (sample['unassigned_shards'] or 0) + (sample['initializing_shards'] or 0)
+
+
+def convergence_metrics(samples):
+    '''
+    Compute the recovery rate and estimated time to green from the samples
+    '''
+    if len(samples) == 0:
+        return {}
+    first = samples[0]
+    last = samples[-1]
+    duration = last['timestamp'] - first['timestamp']
+    start_pending = pending_shards(first)
+    end_pending = pending_shards(last)
+    recovery_rate = 0.0
+    if duration > 0:
+        recovery_rate = (start_pending - end_pending) / float(duration)
+    estimated_time_to_green = None
+    if end_pending == 0:
+        estimated_time_to_green = 0.0
+    elif recovery_rate > 0:
+        estimated_time_to_green = end_pending / recovery_rate
+    return {
+        "duration": duration,
+        "start_pending_shards": start_pending,
+        "end_pending_shards": end_pending,
+        "recovery_rate": recovery_rate,
+        "estimated_time_to_green": estimated_time_to_green,
+        "stalled": len(samples) > 1 and end_pending > 0 and recovery_rate <= 0
+    }
+
+
+def condition_indices(health_data, conditions):
+    '''
+    Return the health of the indices used by the conditions only
+    '''
+    names = set(c['index'] for c in conditions if c.get('index') is not None)
+    return dict((name, health) for name, health in health_data.get('indices', {}).items() if name in names)
+
+
+def build_filter_path(filter_path, conditions):
+    '''
+    Add the fields the module needs to evaluate the health response
+    to the user supplied filter_path
+    '''
+    fields = list(filter_path) + ['status', 'timed_out']
+    for condition in conditions:
+        if condition.get('index') is not None:
+            # Index names may contain dots, which filter_path treats as separators
+            fields.append("indices.*.{0}".format(condition['field']))
+        else:
+            fields.append(condition['field'])
+    return join_filter_path(fields)
+
+
 # ================
 # Module execution
 #
@@ -180,8 +496,20 @@ def main():
         status=dict(type='str', choices=['green', 'yellow', 'red'], default='green'),
         wait_for=dict(type='str', choices=wait_for_choices, default=None),
         to_be=dict(type='str'),
+        indices=dict(type='list', elements='str'),
+        filter_path=dict(type='list', elements='str'),
+        conditions=dict(type='list', elements='dict', options=dict(
+            index=dict(type='str'),
+            field=dict(type='str', required=True, choices=['number_of_shards', 'number_of_replicas'] + wait_for_choices),
+            operator=dict(type='str', choices=list(OPERATORS.keys()), default='=='),
+            value=dict(type='str', required=True)
+        )),
         poll=dict(type='int', default=3),
         interval=dict(type='int', default=10),
+        deadline=dict(type='int'),
+        wait_for_nodes=dict(type='str'),
+        wait_for_no_relocating_shards=dict(type='bool', default=False),
+        record_samples=dict(type='bool', default=False),
         fail_on_exception=dict(type='bool', default=False)
     )
 
@@ -204,6 +532,28 @@ def main():
     poll = module.params['poll']
     to_be = module.params['to_be']
     wait_for = module.params['wait_for']
+    deadline = module.params['deadline']
+    wait_for_nodes = module.params['wait_for_nodes']
+    wait_for_no_relocating_shards = module.params['wait_for_no_relocating_shards']
+    record_samples = module.params['record_samples']
+
+    conditions = []
+    if wait_for is not None:
+        wait_for_operator, wait_for_value = parse_to_be(to_be)
+        conditions.append(dict(field=wait_for, operator=wait_for_operator, value=wait_for_value))
+    conditions.extend(module.params['conditions'] or [])
+    for condition in conditions:
+        if condition.get('index') is None and condition['field'] in ['number_of_shards', 'number_of_replicas']:
+            module.fail_json(msg="The field {0} is only available for index conditions.".format(condition['field']))
+
+    level = module.params['level']
+    filter_path = module.params['filter_path']
+    # Index conditions need the indices level, keep the response as small as a cluster level one
+    compact_indices = level == 'cluster' and any(c.get('index') is not None for c in conditions)
+    if compact_indices:
+        level = 'indices'
+        if not filter_path:
+            filter_path = ['cluster_name'] + wait_for_choices
 
     try:
         elastic = ElasticHelpers(module)
@@ -215,48 +565,87 @@ def main():
         temp_err = None
         msg = None
         failed = True
+        samples = []
+
+        if filter_path and record_samples:
+            filter_path = filter_path + SAMPLE_FIELDS
 
+        start = time.time()
         while iterations < poll:
+            remaining = interval
+            if deadline is not None:
+                remaining = min(interval, max(0, int(deadline - (time.time() - start))))
+            call_start = time.time()
             try:
                 iterations += 1
-                response = client.cluster.health(level=module.params['level'],
-                                                 local=module.params['local'])
+                health_params = dict(level=level,
+                                     local=module.params['local'],
+                                     wait_for_status=status,
+                                     timeout="{0}s".format(remaining))
+                if module.params['indices']:
+                    health_params['index'] = ",".join(module.params['indices'])
+                if filter_path:
+                    health_params['filter_path'] = build_filter_path(filter_path, conditions)
+                if wait_for_nodes is not None:
+                    health_params['wait_for_nodes'] = wait_for_nodes
+                if wait_for_no_relocating_shards:
+                    health_params['wait_for_no_relocating_shards'] = True
+                response = cluster_health(client,
+                                          remaining + module.params['timeout'],
+                                          **health_params)
                 health_data = dict(response)
+                if compact_indices and not module.params['filter_path']:
+                    health_data['indices'] = condition_indices(health_data, conditions)
+                if record_samples:
+                    samples.append(health_sample(health_data, time.time()))
                 if 'status' not in health_data.keys():
                     module.fail_json(msg="Elasticsearch health endpoint did not supply a status field.")
+                elif health_data.get('timed_out', False):
+                    failures += 1
                 else:
                     if elastic_status(status, health_data['status']):
                         msg = "Elasticsearch health is good."
-                        if wait_for is not None:
-                            if health_data[wait_for] == cast_to_be(to_be):
+                        unmet_conditions = [c for c in conditions if not condition_met(health_data, c)]
+                        if len(unmet_conditions) == 0:
+                            if wait_for is not None:
                                 msg += " The variable {0} has reached the value {1}.".format(wait_for, to_be)
-                                failed = False
-                                break
-                            else:
-                                msg = "The variable {0} did not reached the value {1}.".format(wait_for, to_be)
-                                failures += 1
-                        else:
+                            if module.params['conditions']:
+                                msg += " All conditions have been met."
                             failed = False
                             break
+                        elif wait_for is not None and unmet_conditions[0] is conditions[0]:
+                            msg = "The variable {0} did not reached the value {1}.".format(wait_for, to_be)
+                            failures += 1
+                        else:
+                            msg = "The conditions {0} were not met.".format(", ".join(map(format_condition, unmet_conditions)))
+                            failures += 1
                     else:
                         failures += 1
-
-                if iterations == poll:
-                    break
-                else:
-                    time.sleep(interval)
             except Exception as excep:
                 if fail_on_exception:
                     module.fail_json(str(excep))
                 failures += 1
-                if iterations == poll:
-                    break
-                else:
-                    time.sleep(interval)
 
-        if not msg:
+            if iterations == poll:
+                break
+            elif deadline is not None and time.time() - start >= deadline:
+                break
+            else:
+                # The server side wait already spaces out requests that timed out,
+                # only back off for requests that returned early.
+                delay = backoff_delay(failures, interval) - (time.time() - call_start)
+                if deadline is not None:
+                    delay = min(delay, deadline - (time.time() - start))
+                if delay > 0:
+                    time.sleep(delay)
+
+        if not msg or (failed and health_data.get('timed_out', False)):
             msg = "Timed out waiting for elastic health to converge."
 
+        if record_samples:
+            health_data['samples'] = samples
+            health_data['convergence'] = convergence_metrics(samples)
+
         module.exit_json(changed=False,
                          msg=msg,
                          failed=failed,
@@ -33,15 +33,30 @@ options:
     description:
       - The Elastic search settings to update.
       - Supply as a dict key/values.
+      - Nested dicts are flattened, so an C(enable) key nested in C(cluster), C(routing) and C(allocation) dicts
+        is the same as the C(cluster.routing.allocation.enable) key.
+      - Values are compared with the cluster values regardless of their type and unit, C(true) equals C("true")
+        and C(1gb) equals C(1073741824b).
+      - Only the settings that differ are sent to the cluster.
     type: dict
     required: True
 '''
 
 EXAMPLES = r'''
 - name: Update a setting
-  community.elastic.elastic_cluster:
+  community.elastic.elastic_cluster_settings:
     settings:
-      - "indices.recovery.max_bytes_per_sec": "50mb"
+      "indices.recovery.max_bytes_per_sec": "50mb"
+
+- name: Update settings given as nested dicts
+  community.elastic.elastic_cluster_settings:
+    settings:
+      cluster:
+        routing:
+          allocation:
+            enable: all
+      action:
+        destructive_requires_name: true
 
 - name: Reset a bunch of settings to their default value
   community.elastic.elastic_cluster_settings:
@@ -65,19 +80,51 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     elastic_found,
     E_IMP_ERR,
     elastic_common_argument_spec,
-    ElasticHelpers
+    ElasticHelpers,
+    join_filter_path,
+    flatten_settings,
+    same_value
 )
 
 
+SETTINGS_SECTIONS = ['persistent', 'transient', 'defaults']
+
+
 def cluster_put_settings(client, body):
     response = client.cluster.put_settings(body=body, params=None, headers=None)
     return response
 
 
-def cluster_get_settings(client):
-    response = client.cluster.get_settings(include_defaults=True,
-                                           flat_settings=True)
-    return response
+def cluster_get_settings(client, keys, sections):
+    '''
+    Return the flat values of the given settings in the given sections.
+    filter_path restricts the response to those settings. The settings are
+    requested nested because filter_path matches one path element per dot.
+    Defaults are only computed by the cluster when the defaults section is requested.
+    '''
+    settings = dict((section, {}) for section in SETTINGS_SECTIONS)
+    if not keys:
+        return settings
+    fields = ["{0}.{1}".format(section, key) for section in sections for key in keys]
+    params = {}
+    if 'defaults' in sections:
+        params['include_defaults'] = True
+    response = client.cluster.get_settings(filter_path=join_filter_path(fields), **params)
+    if hasattr(response, 'body'):  # Required for Elasticsearch 8.x
+        response = response.body
+    for section in sections:
+        settings[section] = flatten_settings(response.get(section, {}))
+    return settings
+
+
+def keys_needing_defaults(settings, current_settings):
+    '''
+    Return the keys with a desired value that are not set in the section.
+    A key set to another value changes whatever its default, so only the
+    unset keys need the default value to decide if the setting changes.
+    '''
+    return [key for key, value in settings.items()
+            if value is not None and key not in current_settings]
 
 
 # ================
@@ -102,7 +149,8 @@ def main():
                          exception=E_IMP_ERR)
 
     persistent = module.params['persistent']
-    settings = module.params['settings']
+    # Nested settings are flattened to match the keys returned by the cluster
+    settings = flatten_settings(module.params['settings'])
 
     # TODO main module logic
     try:
@@ -114,9 +162,11 @@ def main():
         elastic = ElasticHelpers(module)
         client = elastic.connect()
 
-        current_settings = cluster_get_settings(client)
-        if hasattr(current_settings, 'body'):  # Required for Elasticsearch 8.x
-            current_settings = current_settings.body
+        selected_key = list(settings_doc.keys())[0]
+        current_settings = cluster_get_settings(client, list(settings.keys()), [selected_key])
+        default_keys = keys_needing_defaults(settings, current_settings[selected_key])
+        if default_keys:
+            current_settings['defaults'] = cluster_get_settings(client, default_keys, ['defaults'])['defaults']
 
         if persistent:
             del current_settings['transient']
@@ -129,7 +179,6 @@ def main():
             module.fail_json(msg="Unexpected key found in cluster config: {0}".format(str(unexpected_keys)))
 
         cluster_configuration_changes = {}
-        selected_key = list(settings_doc.keys())[0]
         none_debug = False
         for config_item in list(settings_doc[selected_key].keys()):
             desired_value = None
@@ -140,11 +189,14 @@ def main():
                     "old_value": None,
                     "new_value": "<default>"
                 }
-            elif settings_doc[selected_key][config_item] == \
-                    current_settings[selected_key].get(config_item):
+            elif settings_doc[selected_key][config_item] is None:
+                pass
+            elif same_value(settings_doc[selected_key][config_item],
+                            current_settings[selected_key].get(config_item)):
                 pass
-            elif settings_doc[selected_key][config_item] == \
-                    current_settings["defaults"].get(config_item):
+            elif config_item not in current_settings[selected_key] and \
+                    same_value(settings_doc[selected_key][config_item],
+                               current_settings["defaults"].get(config_item)):
                 pass
             else:
                 # If we reach here the value results in a cluster settings change
@@ -168,7 +220,9 @@ def main():
                                  msg="The cluster configuration has been updated.",
                                  cluster_cfg_changes=cluster_configuration_changes)
             else:
-                response = cluster_put_settings(client, body=settings_doc)
+                # Only the changed settings are sent, in a single request
+                changed_settings = dict((key, settings[key]) for key in cluster_configuration_changes)
+                response = cluster_put_settings(client, body={selected_key: changed_settings})
                 if response['acknowledged']:
                     module.exit_json(changed=True,
                                      msg="The cluster configuration has been updated.",
@@ -68,7 +68,8 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     E_IMP_ERR,
     elastic_common_argument_spec,
     ElasticHelpers,
-    NotFoundError
+    elastic_exceptions,
+    cached
 )
 
 
@@ -82,9 +83,14 @@ def get_component_template(module, client, name):
     Uses the get component template api to return information about the given
     component template name
     '''
+    templates = cached(module, client, 'component_templates')
+    if templates is not None:
+        if name in templates:
+            return {"component_templates": [templates[name]]}
+        return None
     try:
         response = dict(client.cluster.get_component_template(name=name))
-    except NotFoundError as excep:
+    except elastic_exceptions.NotFoundError as excep:
         response = None
     except Exception as excep:
         module.fail_json(msg=str(excep))
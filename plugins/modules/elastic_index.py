@@ -18,8 +18,16 @@ description:
   - Create indexes and drop indexes.
   - Perform some index maintenance operations.
   - Create indexes with settings and mapping documents.
-  - No support for settings or mapping document updates.
+  - The dynamic settings and the mappings of existing indexes are updated with I(state=present).
+    Only the settings that differ and the fields that are missing or differ are sent.
+  - Shrink, split and clone indexes. The module prepares the source index, waits for
+    the shards to be relocated when shrinking and waits for the new index to reach I(status).
+    The replicas, allocation and write block settings of the source index are then restored,
+    whether the resize succeeded or not. When the shrunk index does not reach I(status), the
+    source index stays on the shrink node as the new index may still be recovering from it.
   - check_mode only relevant to present and absent states.
+  - Several indexes can be managed at once. The existing indexes are found with a single
+    request and the actions are applied with multi-index requests.
 
 author: Rhys Campbell (@rhysmeister)
 version_added: "0.0.1"
@@ -37,27 +45,91 @@ options:
       - closed
       - opened
       - clear_cache
+      - clone
       - flush
       - flush_synced
+      - forcemerge
       - refresh
+      - shrink
+      - split
       - stats
       - upgrade
     default: present
   name:
     description:
-      - The index name
-    type: str
+      - The index name, or a list of index names.
+      - Aliases and patterns such as C(logs-*) can be used with every state except present.
+      - With I(state=absent) the names and patterns are sent to the cluster as given. Aliases are rejected and
+        so are patterns when C(action.destructive_requires_name) is set, the default from Elasticsearch 8.0.
+      - With I(state=present) an alias counts as an existing index.
+    type: list
+    elements: str
     required: True
   settings:
     description:
       - Index settings document.
+      - The settings of existing indexes are compared with it when I(state=present) and the
+        dynamic settings that differ are updated. Changing a static setting fails.
+      - The settings of the target index when I(state=shrink), I(state=split) or I(state=clone).
     type: dict
     default: {}
   mappings:
     description:
       - Index mappings document.
+      - The mappings of existing indexes are compared with it when I(state=present). Missing fields
+        are added and changed field parameters are sent to the cluster, which rejects changes
+        that can't be applied such as a new field type.
     type: dict
     default: {}
+  target:
+    description:
+      - The name of the index created when I(state=shrink), I(state=split) or I(state=clone).
+      - Nothing is done if the target index already exists.
+    type: str
+  number_of_shards:
+    description:
+      - The number of primary shards of the target index when I(state=shrink) or I(state=split).
+    type: int
+  shrink_node:
+    description:
+      - The node a copy of every shard is relocated to before shrinking.
+      - Defaults to the node holding the most primary shards of the index.
+    type: str
+  status:
+    description:
+      - The status the target index must reach after I(state=shrink), I(state=split) or I(state=clone).
+    type: str
+    choices:
+      - green
+      - yellow
+    default: green
+  max_num_segments:
+    description:
+      - The number of segments each shard is merged into when I(state=forcemerge).
+      - Indexes whose shards all have this number of segments or fewer are skipped.
+    type: int
+    default: 1
+  only_expunge_deletes:
+    description:
+      - Only expunge the deleted documents when I(state=forcemerge) instead of merging to I(max_num_segments).
+      - Indexes without deleted documents are skipped.
+    type: bool
+    default: false
+  interval:
+    description:
+      - The number of seconds between two checks of the progress of a force merge, shard
+        relocation or index status.
+      - The progress of a force merge is only checked with elasticsearch-py 8.x, older clients
+        wait for the merge request to complete.
+    type: int
+    default: 5
+  wait_timeout:
+    description:
+      - The maximum number of seconds to wait for a force merge to complete, for the shards
+        to be relocated before a shrink or for the target index to reach I(status).
+      - The merge or relocation continues in the cluster when the module times out.
+    type: int
+    default: 3600
   wait_for_active_shards:
     description:
       - A number controlling to how many active shards to wait for.
@@ -81,6 +153,49 @@ EXAMPLES = r'''
     name: myindex
     state: closed
 
+- name: Close all the indexes of last year
+  community.elastic.elastic_index:
+    name: "logs-2021.*"
+    state: closed
+
+- name: Refresh several indexes
+  community.elastic.elastic_index:
+    name:
+      - myindex
+      - myotherindex
+    state: refresh
+
+- name: Merge last month's indexes into a single segment per shard
+  community.elastic.elastic_index:
+    name: "logs-2021.11.*"
+    state: forcemerge
+    max_num_segments: 1
+
+- name: Change the refresh interval of myindex and add a field
+  community.elastic.elastic_index:
+    name: myindex
+    settings:
+      refresh_interval: 30s
+    mappings:
+      properties:
+        city: { "type": "keyword" }
+
+- name: Shrink myindex to a single shard
+  community.elastic.elastic_index:
+    name: myindex
+    state: shrink
+    target: myindex-shrunk
+    number_of_shards: 1
+
+- name: Split myindex into 10 shards
+  community.elastic.elastic_index:
+    name: myindex
+    state: split
+    target: myindex-split
+    number_of_shards: 10
+    settings:
+      index.number_of_replicas: 2
+
 - name: Create an index called myindex with some settings and mappings
   community.elastic.elastic_index:
     name: myindex
@@ -95,6 +210,65 @@ EXAMPLES = r'''
 '''
 
 RETURN = r'''
+msg:
+  description: A short message describing what happened.
+  returned: always
+  type: str
+indices:
+  description: The indexes the action was performed on.
+  returned: when indexes were created, updated, deleted or an index action was performed
+  type: list
+  elements: str
+forcemerge:
+  description: The segment counts of each merged index before and after the merge.
+  returned: when state is forcemerge
+  type: dict
+  sample:
+    myindex:
+      before:
+        segments: 24
+        max_shard_segments: 12
+        deleted_docs: 1000
+      after:
+        segments: 2
+        max_shard_segments: 1
+        deleted_docs: 0
+skipped:
+  description: The indexes that were already merged or are closed.
+  returned: when state is forcemerge
+  type: list
+  elements: str
+timings:
+  description: >
+    How long each phase took in ms. The stats_before, forcemerge and stats_after phases of a force merge.
+    The choose_node, prepare, relocate, shrink, split or clone, wait_for_status and restore phases of a resize.
+  returned: when state is forcemerge, shrink, split or clone
+  type: dict
+changes:
+  description: The settings and mappings sent to each updated index.
+  returned: when state is present
+  type: dict
+  sample:
+    myindex:
+      settings:
+        index.refresh_interval: 30s
+      mappings:
+        properties:
+          city:
+            type: keyword
+target:
+  description: The index created by a shrink, split or clone.
+  returned: when state is shrink, split or clone
+  type: str
+node:
+  description: The node the shards were relocated to before shrinking.
+  returned: when state is shrink
+  type: str
+responses:
+  description: The response of each request when the indexes did not fit in a single request.
+  returned: when more than one request was needed
+  type: list
+  elements: dict
 '''
 
 
@@ -107,8 +281,390 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     elastic_found,
     E_IMP_ERR,
     elastic_common_argument_spec,
-    ElasticHelpers
+    ElasticHelpers,
+    index_batches,
+    is_pattern,
+    elastic_exceptions,
+    timed,
+    wait_for_health,
+    flatten_settings,
+    same_value,
+    __version__
 )
+import json
+import time
+
+
+SEGMENTS_FILTER_PATH = "indices.*.shards.*.segments.count,indices.*.shards.*.docs.deleted"
+
+
+def segment_stats(client, indices):
+    '''
+    Return the number of segments, the largest number of segments of a shard copy and
+    the number of deleted documents of each index
+    '''
+    stats = {}
+    for batch in index_batches(indices):
+        response = dict(client.indices.stats(index=batch,
+                                             metric="segments,docs",
+                                             level="shards",
+                                             filter_path=SEGMENTS_FILTER_PATH))
+        for index, index_stats in response.get('indices', {}).items():
+            entry = {"segments": 0, "max_shard_segments": 0, "deleted_docs": 0}
+            for copies in index_stats.get('shards', {}).values():
+                for shard_copy in copies:
+                    segments = shard_copy.get('segments', {}).get('count', 0)
+                    entry['segments'] += segments
+                    entry['max_shard_segments'] = max(entry['max_shard_segments'], segments)
+                    entry['deleted_docs'] += shard_copy.get('docs', {}).get('deleted', 0)
+            stats[index] = entry
+    return stats
+
+
+def needs_merge(stats, max_num_segments, only_expunge_deletes):
+    if only_expunge_deletes:
+        return stats['deleted_docs'] > 0
+    return stats['max_shard_segments'] > max_num_segments
+
+
+def wait_for_task(client, task_id, interval, wait_timeout):
+    '''
+    Poll the task until it completes. Returns the task response or None on timeout.
+    '''
+    start = time.time()
+    while True:
+        response = dict(client.tasks.get(task_id=task_id))
+        if response.get('completed'):
+            return response
+        if time.time() - start + interval > wait_timeout:
+            return None
+        time.sleep(interval)
+
+
+def start_forcemerge(client, index, max_num_segments, only_expunge_deletes, wait_timeout):
+    '''
+    Start a force merge as a task and return the task id. Clients older than 8.0 can't start
+    it as a task, the merge request then blocks until it completes and None is returned.
+    '''
+    params = {}
+    if only_expunge_deletes:
+        params['only_expunge_deletes'] = True
+    else:
+        params['max_num_segments'] = max_num_segments
+    if __version__ >= (8, 0, 0):
+        response = client.indices.forcemerge(index=index, wait_for_completion=False, **params)
+        return response['task']
+    client.indices.forcemerge(index=index, request_timeout=wait_timeout, **params)
+    return None
+
+
+def forcemerge(module, client, indices):
+    '''
+    Force merge the indexes that are not merged yet, one task per batch of indexes,
+    and exit with the segment counts before and after the merge
+    '''
+    max_num_segments = module.params['max_num_segments']
+    only_expunge_deletes = module.params['only_expunge_deletes']
+    timings = {}
+    before = timed(timings, 'stats_before', segment_stats, client, indices)
+    # Closed indexes have no segment stats and can't be merged
+    merge = [index for index in indices
+             if index in before and needs_merge(before[index], max_num_segments, only_expunge_deletes)]
+    skipped = [index for index in indices if index not in merge]
+    if not merge or module.check_mode:
+        module.exit_json(changed=len(merge) > 0,
+                         msg="{0} indexes to force merge, {1} already merged.".format(len(merge), len(skipped)),
+                         indices=merge,
+                         skipped=skipped,
+                         forcemerge=dict((index, {"before": before[index]}) for index in merge),
+                         timings=timings)
+
+    def run_tasks():
+        for batch in index_batches(merge):
+            try:
+                task_id = start_forcemerge(client, batch, max_num_segments, only_expunge_deletes, module.params['wait_timeout'])
+            except elastic_exceptions.ConnectionTimeout:
+                module.fail_json(msg="The force merge did not complete within {0} seconds.".format(module.params['wait_timeout']))
+            if task_id is None:
+                continue
+            response = wait_for_task(client, task_id, module.params['interval'], module.params['wait_timeout'])
+            if response is None:
+                module.fail_json(msg="The force merge task {0} did not complete within {1} seconds.".format(task_id, module.params['wait_timeout']),
+                                 task=task_id)
+            if 'error' in response:
+                module.fail_json(msg="The force merge task {0} failed: {1}".format(task_id, response['error']))
+
+    timed(timings, 'forcemerge', run_tasks)
+    after = timed(timings, 'stats_after', segment_stats, client, merge)
+    module.exit_json(changed=True,
+                     msg="{0} indexes were force merged, {1} already merged.".format(len(merge), len(skipped)),
+                     indices=merge,
+                     skipped=skipped,
+                     forcemerge=dict((index, {"before": before[index], "after": after.get(index)}) for index in merge),
+                     timings=timings)
+
+
+STATIC_SETTINGS = [
+    "index.number_of_shards",
+    "index.number_of_routing_shards",
+    "index.codec",
+    "index.routing_partition_size",
+    "index.soft_deletes.enabled",
+    "index.load_fixed_bitset_filters_eagerly",
+    "index.shard.check_on_startup",
+    "index.sort.field",
+    "index.sort.order"
+]
+
+
+def canonical_equal(desired, current):
+    return desired == current or same_value(desired, current)
+
+
+def contains(current, desired):
+    '''
+    Return true if every value of desired is set to the same value in current
+    '''
+    if isinstance(desired, dict):
+        return isinstance(current, dict) and all(k in current and contains(current[k], v) for k, v in desired.items())
+    return canonical_equal(desired, current)
+
+
+def mapping_delta(desired, current):
+    '''
+    Return the part of the desired mapping that is missing from or differs in the current mapping.
+    Fields are sent whole as a partial field definition is not valid, object fields are compared field by field.
+    '''
+    delta = {}
+    for key, value in desired.items():
+        # Elasticsearch leaves the default object type out of the mapping of fields with properties
+        if key == 'type' and value == 'object' and 'properties' in desired:
+            continue
+        if key == 'properties':
+            properties = {}
+            current_properties = current.get('properties', {})
+            for field, definition in value.items():
+                current_definition = current_properties.get(field)
+                if current_definition is None:
+                    properties[field] = definition
+                elif 'properties' in definition:
+                    field_delta = mapping_delta(definition, current_definition)
+                    if field_delta:
+                        properties[field] = field_delta
+                elif not contains(current_definition, definition):
+                    properties[field] = definition
+            if properties:
+                delta['properties'] = properties
+        elif key not in current or not contains(current[key], value):
+            delta[key] = value
+    return delta
+
+
+def index_changes(client, indices, settings, mappings):
+    '''
+    Return the settings and mappings to send to each existing index, fetched with one request per batch of indexes.
+    Raises ValueError when a static setting differs.
+    '''
+    desired_settings = dict((key if key.startswith('index.') else 'index.' + key, value)
+                            for key, value in flatten_settings(settings).items())
+    changes = {}
+    for batch in index_batches(indices):
+        response = dict(client.indices.get(index=batch, flat_settings=True, filter_path='*.settings,*.mappings'))
+        for index, current in response.items():
+            current_settings = current.get('settings', {})
+            settings_delta = {}
+            for key, value in desired_settings.items():
+                current_value = current_settings.get(key)
+                if (value is None and current_value is None) or canonical_equal(value, current_value):
+                    continue
+                if key in STATIC_SETTINGS:
+                    raise ValueError("The static setting {0} of the index '{1}' can't be updated.".format(key, index))
+                settings_delta[key] = value
+            change = {}
+            if settings_delta:
+                change['settings'] = settings_delta
+            if mappings:
+                delta = mapping_delta(mappings, current.get('mappings', {}))
+                if delta:
+                    change['mappings'] = delta
+            if change:
+                changes[index] = change
+    return changes
+
+
+def put_index_mappings(client, index, mappings):
+    response = client.indices.put_mapping(index=index, body=mappings)
+    return response
+
+
+def apply_index_changes(client, changes):
+    '''
+    Send the changes, indexes with the same changes are updated together
+    '''
+    for kind, put in [('settings', put_index_settings), ('mappings', put_index_mappings)]:
+        groups = {}
+        for index, change in changes.items():
+            if kind in change:
+                groups.setdefault(json.dumps(change[kind], sort_keys=True), []).append(index)
+        for delta, indices in groups.items():
+            for batch in index_batches(sorted(indices)):
+                put(client, batch, json.loads(delta))
+
+
+def create_indices(elastic, client, indices, body):
+    '''
+    Create the indexes and return the response of the last one. Several indexes are
+    created concurrently with the async client when async_requests is set.
+    '''
+    if len(indices) < 2 or not elastic.async_available():
+        response = None
+        for index in indices:
+            response = dict(client.indices.create(index=index, body=body))
+        return response
+    async_client = elastic.connect_async()
+    try:
+        responses = elastic.run_concurrently([lambda index=index: async_client.indices.create(index=index, body=body)
+                                              for index in indices])
+    finally:
+        elastic.close_async(async_client)
+    for response in responses:
+        if isinstance(response, Exception):
+            raise response
+    return dict(responses[-1])
+
+
+RESIZED = {"shrink": "shrunk", "split": "split", "clone": "cloned"}
+
+# The settings of the source index changed to prepare a shrink, split or clone
+SOURCE_SETTINGS = ["index.number_of_replicas", "index.routing.allocation.require._name", "index.blocks.write"]
+
+
+def put_index_settings(client, index, settings):
+    response = client.indices.put_settings(index=index, body=settings)
+    return response
+
+
+def index_settings(client, index, names):
+    '''
+    Return the value of each named setting of the index, None for the settings that are not set
+    '''
+    response = dict(client.indices.get_settings(index=index, name=",".join(names), flat_settings=True))
+    settings = response[index]['settings']
+    return dict((name, settings.get(name)) for name in names)
+
+
+def shard_nodes(client, index):
+    '''
+    Return the state, type (p or r) and node of each shard copy of the index
+    '''
+    return list(client.cat.shards(index=index, format='json', h='state,prirep,node'))
+
+
+def choose_shrink_node(client, index):
+    '''
+    Return the node holding the most primary shards of the index so the fewest shards are relocated
+    '''
+    counts = {}
+    for shard in shard_nodes(client, index):
+        if shard['prirep'] == 'p' and shard['node']:
+            counts[shard['node']] = counts.get(shard['node'], 0) + 1
+    return max(sorted(counts), key=lambda node: counts[node])
+
+
+def wait_for_relocation(client, index, node, interval, timeout, wait_timeout):
+    '''
+    Wait until every shard copy of the index is started on the node
+    '''
+    start = time.time()
+    while True:
+        remaining = wait_timeout - (time.time() - start)
+        if remaining <= 0:
+            return False
+        wait_for_health(client, interval, timeout, remaining,
+                        index=index,
+                        wait_for_no_relocating_shards=True,
+                        wait_for_no_initializing_shards=True)
+        shards = shard_nodes(client, index)
+        if all(shard['state'] == 'STARTED' and shard['node'] == node for shard in shards):
+            return True
+        time.sleep(min(interval, max(0, wait_timeout - (time.time() - start))))
+
+
+def resize_index(module, client, source, method):
+    '''
+    Shrink, split or clone the source index into the target index. Each phase is timed.
+    '''
+    target = module.params['target']
+    interval = module.params['interval']
+    timeout = module.params['timeout']
+    wait_timeout = module.params['wait_timeout']
+    timings = {}
+    result = {}
+
+    if client.indices.exists(index=target):
+        module.exit_json(changed=False, msg="The index '{0}' already exists.".format(target), target=target)
+    if module.check_mode:
+        module.exit_json(changed=True,
+                         msg="The index '{0}' was {1} into '{2}'.".format(source, RESIZED[method], target),
+                         target=target)
+
+    target_settings = dict((key if key.startswith('index.') else 'index.' + key, value)
+                           for key, value in flatten_settings(module.params['settings']).items())
+    if module.params['number_of_shards'] is not None:
+        target_settings['index.number_of_shards'] = module.params['number_of_shards']
+
+    # The settings changed on the source index are restored once the resize is done or has failed
+    original_settings = index_settings(client, source, SOURCE_SETTINGS)
+    error = None
+    resized = False
+    ready = False
+    try:
+        if method == 'shrink':
+            node = module.params['shrink_node']
+            if node is None:
+                node = timed(timings, 'choose_node', choose_shrink_node, client, source)
+            result['node'] = node
+            # A copy of every shard must be on the same node, replicas are dropped to relocate less data
+            timed(timings, 'prepare', put_index_settings, client, source, {
+                "index.routing.allocation.require._name": node,
+                "index.number_of_replicas": 0,
+                "index.blocks.write": True
+            })
+            if not timed(timings, 'relocate', wait_for_relocation, client, source, node, interval, timeout, wait_timeout):
+                error = "The shards of '{0}' were not relocated to {1} within {2} seconds.".format(source, node, wait_timeout)
+            # Remove the requirements copied from the source index
+            target_settings.setdefault("index.routing.allocation.require._name", None)
+            target_settings.setdefault("index.blocks.write", None)
+            target_settings.setdefault("index.number_of_replicas", original_settings["index.number_of_replicas"])
+        else:
+            timed(timings, 'prepare', put_index_settings, client, source, {"index.blocks.write": True})
+            target_settings.setdefault("index.blocks.write", None)
+
+        if error is None:
+            resize = getattr(client.indices, method)
+            timed(timings, method, resize, index=source, target=target, body={"settings": target_settings})
+            resized = True
+            ready = timed(timings, 'wait_for_status', wait_for_health, client, interval, timeout, wait_timeout,
+                          index=target, wait_for_status=module.params['status'])
+            if not ready:
+                error = "The index '{0}' did not reach the status {1} within {2} seconds.".format(target, module.params['status'], wait_timeout)
+                result['target'] = target
+    finally:
+        restore = dict(original_settings)
+        if method == 'shrink' and resized and not ready:
+            # The shrunk index recovers from the shards of the source index, they must stay on the node
+            del restore["index.routing.allocation.require._name"]
+            if error is not None:
+                error += " The allocation requirement of '{0}' on {1} was left in place.".format(source, result['node'])
+        timed(timings, 'restore', put_index_settings, client, source, restore)
+
+    if error is not None:
+        module.fail_json(msg=error, timings=timings, **result)
+    module.exit_json(changed=True,
+                     msg="The index '{0}' was {1} into '{2}'.".format(source, RESIZED[method], target),
+                     target=target,
+                     timings=timings,
+                     **result)
 
 
 # ================
@@ -123,19 +679,31 @@ def main():
         "closed",
         "opened",
         "clear_cache",
+        "clone",
         "flush",
         "flush_synced",
+        "forcemerge",
         "refresh",
+        "shrink",
+        "split",
         "stats",
         "upgrade"
     ]
 
     argument_spec = elastic_common_argument_spec()
     argument_spec.update(
-        name=dict(type='str', required=True),
+        name=dict(type='list', elements='str', required=True),
         state=dict(type='str', choices=state_choices, default='present'),
         settings=dict(type='dict', default={}),
         mappings=dict(type='dict', default={}),
+        target=dict(type='str'),
+        number_of_shards=dict(type='int'),
+        shrink_node=dict(type='str'),
+        status=dict(type='str', choices=['green', 'yellow'], default='green'),
+        max_num_segments=dict(type='int', default=1),
+        only_expunge_deletes=dict(type='bool', default=False),
+        interval=dict(type='int', default=5),
+        wait_timeout=dict(type='int', default=3600),
         wait_for_active_shards=dict(type='str', default='0'),
     )
 
@@ -143,13 +711,19 @@ def main():
         argument_spec=argument_spec,
         supports_check_mode=True,
         required_together=[['login_user', 'login_password']],
+        required_if=[
+            ['state', 'shrink', ['target']],
+            ['state', 'split', ['target', 'number_of_shards']],
+            ['state', 'clone', ['target']],
+        ],
     )
 
     if not elastic_found:
         module.fail_json(msg=missing_required_lib('elasticsearch'),
                          exception=E_IMP_ERR)
 
-    name = module.params['name']
+    names = module.params['name']
+    name = ",".join(names)
     settings = module.params['settings']
     mappings = module.params['mappings']
     state = module.params['state']
@@ -160,22 +734,53 @@ def main():
         client = elastic.connect()
 
         if state == 'present':
-            if client.indices.exists(index=name):
-                module.exit_json(changed=False, msg="The index '{0}' already exists.".format(name))
+            if [n for n in names if '*' in n]:
+                module.fail_json(msg="Index patterns can't be used to create indexes.")
+            existing = elastic.existing_indices(client, names)
+            unresolved = [n for n in names if n not in existing]
+            aliases = elastic.existing_aliases(client, unresolved)
+            missing = [n for n in unresolved if n not in aliases]
+            changes = {}
+            if existing and (settings or mappings):
+                try:
+                    changes = index_changes(client, existing, settings, mappings)
+                except ValueError as excep:
+                    module.fail_json(msg=str(excep))
+            if not missing and not changes:
+                module.exit_json(changed=False, msg="The index '{0}' already exists.".format(name), changes={})
             else:
                 request_body = {"settings": settings, "mappings": mappings}
-                if module.check_mode:
-                    response = {"acknowledged": True}
-                else:
-                    response = dict(client.indices.create(index=name, body=request_body))
-                module.exit_json(changed=True, msg="The index '{0}' was created.".format(name), **response)
+                response = {"acknowledged": True}
+                if not module.check_mode:
+                    if missing:
+                        response = create_indices(elastic, client, missing, request_body)
+                    apply_index_changes(client, changes)
+                messages = []
+                if missing:
+                    messages.append("The index '{0}' was created.".format(",".join(missing)))
+                if changes:
+                    messages.append("The index '{0}' was updated.".format(",".join(sorted(changes))))
+                module.exit_json(changed=True,
+                                 msg=" ".join(messages),
+                                 indices=missing + sorted(changes),
+                                 changes=changes,
+                                 **response)
         elif state == 'absent':
-            if client.indices.exists(index=name):
-                if module.check_mode:
-                    response = {"acknowledged": True}
-                else:
-                    response = dict(client.indices.delete(index=name))
-                module.exit_json(changed=True, msg="The index '{0}' was deleted.".format(name), **response)
+            existing = elastic.existing_indices(client, names)
+            if existing:
+                # The names and patterns are sent as given, the cluster rejects aliases and,
+                # when action.destructive_requires_name is set, wildcards
+                unresolved = [n for n in names if n not in existing and not is_pattern(n)]
+                aliases = elastic.existing_aliases(client, unresolved)
+                targets = [n for n in names if n not in unresolved or n in aliases]
+                responses = [{"acknowledged": True}]
+                if not module.check_mode:
+                    responses = [dict(client.indices.delete(index=batch)) for batch in index_batches(targets)]
+                response = responses[0] if len(responses) == 1 else {"responses": responses}
+                module.exit_json(changed=True,
+                                 msg="The index '{0}' was deleted.".format(name),
+                                 indices=existing,
+                                 **response)
             else:
                 module.exit_json(changed=False, msg="The index '{0}' does not exist.".format(name))
         elif state == "closed":
@@ -184,6 +789,23 @@ def main():
             elastic.index_dynamic_method(module, client, 'open', name)
         elif state == "upgrade":
             elastic.index_dynamic_method(module, client, 'upgrade', name)
+        elif state == "forcemerge":
+            try:
+                indices = elastic.existing_indices(client, names, ignore_missing=False)
+            except elastic_exceptions.NotFoundError:
+                indices = []
+            if not indices:
+                module.fail_json(msg='Cannot perform forcemerge action on an index that does not exist')
+            forcemerge(module, client, indices)
+        elif state in ["shrink", "split", "clone"]:
+            if len(names) != 1 or '*' in name:
+                module.fail_json(msg="A single index must be given to {0}.".format(state))
+            indices = elastic.existing_indices(client, names)
+            if not indices:
+                module.fail_json(msg='Cannot perform {0} action on an index that does not exist'.format(state))
+            if indices != [name]:
+                module.fail_json(msg="'{0}' is an alias, the index to {1} must be given by name.".format(name, state))
+            resize_index(module, client, name, state)
         elif state == "stats":
             response = dict(client.indices.stats(index=name))
             module.exit_json(changed=True, msg="Stats from index '{0}'.".format(name), **response)
@@ -15,6 +15,7 @@ short_description: Returns info about Elasticsearch indexes.
 
 description:
   - Returns info about Elasticsearch indexes.
+  - Several indexes, aliases and patterns are handled with a single request.
 
 author: Rhys Campbell (@rhysmeister)
 version_added: "0.0.1"
@@ -25,8 +26,10 @@ extends_documentation_fragment:
 options:
   name:
     description:
-      - The index name to get information about.
-    type: str
+      - The names of the indexes to get information about.
+      - Aliases and patterns such as C(logs-*) are accepted.
+    type: list
+    elements: str
     required: True
   wait_for_active_shards:
     description:
@@ -34,15 +37,114 @@ options:
       - all to wait for all shards in the cluster to be active, or 0 to not wait.
     type: str
     default: '0'
+  filter_path:
+    description:
+      - Only return these fields of the index information, for example C(*.settings.index.number_of_replicas).
+      - Reduces the size of the response for indexes with large mappings.
+    type: list
+    elements: str
+  summary:
+    description:
+      - Return a compact summary of each index, its health, status, number of documents,
+        size and shards, instead of its settings, mappings and aliases.
+      - Uses the cat indices API, so large inventories stay small and run in one request.
+    type: bool
+    default: false
+  stats:
+    description:
+      - Return a sizing report of the indexes built from their shard statistics, sorted by size.
+      - Reports the shards larger than I(max_shard_size) and the indexes with more than
+        I(max_segments_per_shard) segments per shard on average.
+      - Only the store, docs and segments statistics are requested.
+    type: bool
+    default: false
+  max_shard_size:
+    description:
+      - Shards larger than this are reported in C(oversized_shards) when I(stats=true).
+    type: str
+    default: 50gb
+  max_segments_per_shard:
+    description:
+      - Indexes with more segments per shard than this are reported in C(segment_heavy_indices) when I(stats=true).
+    type: int
+    default: 50
+  top:
+    description:
+      - Only report the I(top) largest indexes and shards when I(stats=true), 0 reports all of them.
+    type: int
+    default: 0
 '''
 
 EXAMPLES = r'''
 - name: Get info for myindex
   community.elastic.elastic_index_info:
     name: myindex
+
+- name: Get the number of shards and replicas of myindex only
+  community.elastic.elastic_index_info:
+    name: myindex
+    filter_path:
+      - "*.settings.index.number_of_shards"
+      - "*.settings.index.number_of_replicas"
+
+- name: Get info for several indexes
+  community.elastic.elastic_index_info:
+    name:
+      - myindex
+      - myotherindex
+
+- name: Summarize all the logs indexes
+  community.elastic.elastic_index_info:
+    name: "logs-*"
+    summary: yes
+
+- name: Report the size of the logs indexes and their oversized shards
+  community.elastic.elastic_index_info:
+    name: "logs-*"
+    stats: yes
+    max_shard_size: 30gb
+    top: 20
 '''
 
 RETURN = r'''
+msg:
+  description: A short message describing what happened.
+  returned: always
+  type: str
+indices:
+  description: The summary of each index, keyed by index name.
+  returned: when summary is true
+  type: dict
+  sample:
+    myindex:
+      health: green
+      status: open
+      docs: 1000
+      size: 52340
+      primaries: 1
+      replicas: 1
+report:
+  description: The sizing report of the indexes.
+  returned: when stats is true
+  type: dict
+  contains:
+    totals:
+      description: The number of indexes and shards, the primary documents and the store size in bytes of all the indexes.
+      type: dict
+    indices:
+      description: >
+        The documents, store size, primary store size, number of shards and primaries, largest
+        primary shard size and segment counts of each index, largest first.
+      type: list
+      elements: dict
+    oversized_shards:
+      description: The index, number and size of each primary shard larger than max_shard_size, largest first.
+      type: list
+      elements: dict
+    segment_heavy_indices:
+      description: The indexes with more segments per shard than max_segments_per_shard, most segments first.
+      type: list
+      elements: dict
 '''
 
 
@@ -55,10 +157,113 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     elastic_found,
     E_IMP_ERR,
     elastic_common_argument_spec,
-    ElasticHelpers
+    ElasticHelpers,
+    join_filter_path,
+    is_pattern,
+    cached,
+    elastic_exceptions,
+    size_in_bytes
 )
 
 
+SUMMARY_COLUMNS = "index,health,status,docs.count,store.size,pri,rep"
+
+
+def to_int(value):
+    if value is None:
+        return None
+    return int(value)
+
+
+def index_summary(client, index):
+    '''
+    Return the health, status, document count, size in bytes and shards of the
+    indexes matching index with a single cat indices request
+    '''
+    response = client.cat.indices(index=index, format='json', h=SUMMARY_COLUMNS, bytes='b')
+    summary = {}
+    for row in response:
+        summary[row['index']] = {
+            "health": row['health'],
+            "status": row['status'],
+            "docs": to_int(row.get('docs.count')),
+            "size": to_int(row.get('store.size')),
+            "primaries": to_int(row.get('pri')),
+            "replicas": to_int(row.get('rep'))
+        }
+    return summary
+
+
+STATS_FILTER_PATH = join_filter_path([
+    "indices.*.shards.*.routing.primary",
+    "indices.*.shards.*.docs.count",
+    "indices.*.shards.*.store.size_in_bytes",
+    "indices.*.shards.*.segments.count"
+])
+
+
+def shard_stats(client, index):
+    '''
+    Return the store, docs and segments statistics of each shard copy of the indexes
+    '''
+    response = client.indices.stats(index=index,
+                                    metric="store,docs,segments",
+                                    level="shards",
+                                    filter_path=STATS_FILTER_PATH)
+    return dict(response).get('indices', {})
+
+
+def stats_report(indices, max_shard_size, max_segments_per_shard, top):
+    '''
+    Aggregate the shard statistics into a report of the size of each index
+    in a single pass over the shards
+    '''
+    report_indices = []
+    oversized_shards = []
+    totals = {"indices": 0, "shards": 0, "docs": 0, "store_size": 0}
+    for name, index_stats in indices.items():
+        entry = {"index": name, "docs": 0, "store_size": 0, "primary_store_size": 0,
+                 "shards": 0, "primaries": 0, "max_shard_size": 0, "segments": 0}
+        for shard, copies in index_stats.get('shards', {}).items():
+            for shard_copy in copies:
+                primary = shard_copy.get('routing', {}).get('primary', False)
+                size = shard_copy.get('store', {}).get('size_in_bytes', 0)
+                entry['shards'] += 1
+                entry['store_size'] += size
+                entry['segments'] += shard_copy.get('segments', {}).get('count', 0)
+                if primary:
+                    entry['primaries'] += 1
+                    entry['primary_store_size'] += size
+                    entry['docs'] += shard_copy.get('docs', {}).get('count', 0)
+                    entry['max_shard_size'] = max(entry['max_shard_size'], size)
+                    if size > max_shard_size:
+                        oversized_shards.append({"index": name, "shard": int(shard), "size": size})
+        entry['segments_per_shard'] = round(float(entry['segments']) / entry['shards'], 1) if entry['shards'] else 0.0
+        report_indices.append(entry)
+        totals['indices'] += 1
+        totals['shards'] += entry['shards']
+        totals['docs'] += entry['docs']
+        totals['store_size'] += entry['store_size']
+
+    report_indices.sort(key=lambda entry: entry['store_size'], reverse=True)
+    oversized_shards.sort(key=lambda shard: shard['size'], reverse=True)
+    segment_heavy_indices = [{"index": entry['index'],
+                              "segments": entry['segments'],
+                              "segments_per_shard": entry['segments_per_shard']}
+                             for entry in report_indices if entry['segments_per_shard'] > max_segments_per_shard]
+    segment_heavy_indices.sort(key=lambda entry: entry['segments_per_shard'], reverse=True)
+    if top > 0:
+        report_indices = report_indices[:top]
+        oversized_shards = oversized_shards[:top]
+        segment_heavy_indices = segment_heavy_indices[:top]
+    return {
+        "totals": totals,
+        "indices": report_indices,
+        "oversized_shards": oversized_shards,
+        "segment_heavy_indices": segment_heavy_indices
+    }
+
+
 # ================
 # Module execution
 #
@@ -67,31 +272,76 @@ def main():
 
     argument_spec = elastic_common_argument_spec()
     argument_spec.update(
-        name=dict(type='str', required=True),
+        name=dict(type='list', elements='str', required=True),
         wait_for_active_shards=dict(type='str', default='0'),
+        filter_path=dict(type='list', elements='str'),
+        summary=dict(type='bool', default=False),
+        stats=dict(type='bool', default=False),
+        max_shard_size=dict(type='str', default='50gb'),
+        max_segments_per_shard=dict(type='int', default=50),
+        top=dict(type='int', default=0),
     )
 
     module = AnsibleModule(
         argument_spec=argument_spec,
         supports_check_mode=True,
         required_together=[['login_user', 'login_password']],
+        mutually_exclusive=[['summary', 'stats']],
     )
 
     if not elastic_found:
         module.fail_json(msg=missing_required_lib('elasticsearch'),
                          exception=E_IMP_ERR)
 
-    name = module.params['name']
+    names = module.params['name']
+    index = ",".join(names)
 
     try:
         elastic = ElasticHelpers(module)
         client = elastic.connect()
 
-        if client.indices.exists(index=name):
-            response = dict(client.indices.get(index=name))
-            module.exit_json(changed=False, msg="Info about index {0}.".format(name), **response)
-        else:
-            module.exit_json(changed=False, msg="The index {0} does not exist.".format(name))
+        if module.params['summary']:
+            try:
+                summary = index_summary(client, index)
+            except elastic_exceptions.NotFoundError:
+                module.exit_json(changed=False, msg="The index {0} does not exist.".format(index), indices={})
+            module.exit_json(changed=False, msg="Summary of {0} indexes.".format(len(summary)), indices=summary)
+
+        if module.params['stats']:
+            try:
+                max_shard_size = size_in_bytes(module.params['max_shard_size'])
+            except ValueError as excep:
+                module.fail_json(msg=str(excep))
+            try:
+                indices = shard_stats(client, index)
+            except elastic_exceptions.NotFoundError:
+                module.exit_json(changed=False, msg="The index {0} does not exist.".format(index), report={})
+            report = stats_report(indices, max_shard_size, module.params['max_segments_per_shard'], module.params['top'])
+            totals = report['totals']
+            module.exit_json(changed=False,
+                             msg="Statistics of {0} indexes and {1} shards.".format(totals['indices'], totals['shards']),
+                             report=report)
+
+        # Only the requested indexes are cached, aliases and patterns are requested from the cluster
+        indices = None
+        if not module.params['filter_path'] and not any(is_pattern(name) for name in names):
+            indices = cached(module, client, 'indices', names)
+        if indices is not None and all(name in indices for name in names):
+            module.exit_json(changed=False,
+                             msg="Info about index {0}.".format(index),
+                             **dict((name, indices[name]) for name in names))
+
+        params = {}
+        if module.params['filter_path']:
+            params['filter_path'] = join_filter_path(module.params['filter_path'])
+        if len(names) > 1:
+            # Return the indexes that exist instead of failing on the first missing one
+            params['ignore_unavailable'] = True
+        try:
+            response = dict(client.indices.get(index=index, **params))
+        except elastic_exceptions.NotFoundError:
+            module.exit_json(changed=False, msg="The index {0} does not exist.".format(index))
+        module.exit_json(changed=False, msg="Info about index {0}.".format(index), **response)
     except Exception as excep:
         module.fail_json(msg='Elastic error: %s' % to_native(excep))
 
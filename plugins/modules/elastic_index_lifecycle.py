@@ -22,6 +22,7 @@ version_added: "0.0.1"
 
 extends_documentation_fragment:
   - community.elastic.login_options
+  - community.elastic.login_options.clusters
 
 options:
   state:
@@ -84,21 +85,28 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     elastic_found,
     E_IMP_ERR,
     elastic_common_argument_spec,
+    elastic_clusters_argument_spec,
     ElasticHelpers,
-    NotFoundError,
-    __version__
+    elastic_exceptions,
+    __version__,
+    cached
 )
 import json
 
 
-def get_policy(client, name):
+def get_policy(module, client, name):
     '''
     Gets the policy document specified by name
     '''
+    policies = cached(module, client, 'ilm')
+    if policies is not None:
+        if name in policies:
+            return policies[name]['policy']
+        return None
     try:
         name_arg = {('policy', 'name')[__version__ >= (8, 0, 0)]: name}
         policy_doc = client.ilm.get_lifecycle(**name_arg)[name]['policy']
-    except NotFoundError:
+    except elastic_exceptions.NotFoundError:
         policy_doc = None
     return policy_doc
 
@@ -122,6 +130,48 @@ def lifecycle_is_different(current_policy, module):
         is_different = True
     return is_different
 
+
+def manage_policy(module, client):
+    '''
+    Brings the ILM policy to the requested state on the cluster the client is connected to
+    '''
+    name = module.params['name']
+    state = module.params['state']
+    policy = module.params['policy']
+
+    current_policy = get_policy(module, client, name)
+
+    if state == 'present':
+        request_body = {"policy": policy}
+        if current_policy is not None:
+            if lifecycle_is_different(current_policy, module):
+                if module.check_mode:
+                    response = {"acknowledged": True}
+                else:
+                    name_arg = {('policy', 'name')[__version__ >= (8, 0, 0)]: name, 'body': request_body}
+                    response = dict(client.ilm.put_lifecycle(**name_arg))
+                module.exit_json(changed=True, msg="The ILM Policy '{0}' was updated.".format(name), **response)
+            else:
+                module.exit_json(changed=False, msg="The ILM Policy '{0}' is configured as specified.".format(name))
+        else:
+            if module.check_mode:
+                response = {"acknowledged": True}
+            else:
+                name_arg = {('policy', 'name')[__version__ >= (8, 0, 0)]: name, 'body': request_body}
+                response = dict(client.ilm.put_lifecycle(**name_arg))
+            module.exit_json(changed=True, msg="The ILM Policy '{0}' was created.".format(name), **response)
+    elif state == 'absent':
+        if current_policy is not None:
+            if module.check_mode:
+                response = {"acknowledged": True}
+            else:
+                name_arg = {('policy', 'name')[__version__ >= (8, 0, 0)]: name}
+                response = dict(client.ilm.delete_lifecycle(**name_arg))
+            module.exit_json(changed=True, msg="The ILM Policy '{0}' was deleted.".format(name), **response)
+        else:
+            module.exit_json(changed=False, msg="The ILM Policy '{0}' does not exist.".format(name))
+
+
 # ================
 # Module execution
 #
@@ -135,6 +185,7 @@ def main():
     ]
 
     argument_spec = elastic_common_argument_spec()
+    argument_spec.update(elastic_clusters_argument_spec())
     argument_spec.update(
         name=dict(type='str', required=True),
         state=dict(type='str', choices=state_choices, default='present'),
@@ -152,45 +203,9 @@ def main():
         module.fail_json(msg=missing_required_lib('elasticsearch'),
                          exception=E_IMP_ERR)
 
-    name = module.params['name']
-    state = module.params['state']
-    policy = module.params['policy']
-
     try:
         elastic = ElasticHelpers(module)
-        client = elastic.connect()
-
-        current_policy = get_policy(client, name)
-
-        if state == 'present':
-            request_body = {"policy": policy}
-            if current_policy is not None:
-                if lifecycle_is_different(current_policy, module):
-                    if module.check_mode:
-                        response = {"acknowledged": True}
-                    else:
-                        name_arg = {('policy', 'name')[__version__ >= (8, 0, 0)]: name, 'body': request_body}
-                        response = dict(client.ilm.put_lifecycle(**name_arg))
-                    module.exit_json(changed=True, msg="The ILM Policy '{0}' was updated.".format(name), **response)
-                else:
-                    module.exit_json(changed=False, msg="The ILM Policy '{0}' is configured as specified.".format(name))
-            else:
-                if module.check_mode:
-                    response = {"acknowledged": True}
-                else:
-                    name_arg = {('policy', 'name')[__version__ >= (8, 0, 0)]: name, 'body': request_body}
-                    response = dict(client.ilm.put_lifecycle(**name_arg))
-                module.exit_json(changed=True, msg="The ILM Policy '{0}' was created.".format(name), **response)
-        elif state == 'absent':
-            if current_policy is not None:
-                if module.check_mode:
-                    response = {"acknowledged": True}
-                else:
-                    name_arg = {('policy', 'name')[__version__ >= (8, 0, 0)]: name}
-                    response = dict(client.ilm.delete_lifecycle(**name_arg))
-                module.exit_json(changed=True, msg="The ILM Policy '{0}' was deleted.".format(name), **response)
-            else:
-                module.exit_json(changed=False, msg="The ILM Policy '{0}' does not exist.".format(name))
+        elastic.run(manage_policy)
     except Exception as excep:
         module.fail_json(msg='Elastic error: %s' % to_native(excep))
 
@@ -22,6 +22,7 @@ version_added: "1.2.0"
 
 extends_documentation_fragment:
   - community.elastic.login_options
+  - community.elastic.login_options.clusters
 
 options:
   state:
@@ -62,8 +63,10 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     elastic_found,
     E_IMP_ERR,
     elastic_common_argument_spec,
+    elastic_clusters_argument_spec,
     ElasticHelpers,
-    NotFoundError
+    elastic_exceptions,
+    cached
 )
 
 
@@ -76,9 +79,14 @@ def get_index_template(module, client, name):
     '''
     Uses the get _index_template api to return information about the given template
     '''
+    templates = cached(module, client, 'index_templates')
+    if templates is not None:
+        if name in templates:
+            return {"index_templates": [templates[name]]}
+        return None
     try:
         response = dict(client.indices.get_index_template(name=name))
-    except NotFoundError as excep:
+    except elastic_exceptions.NotFoundError as excep:
         response = None
     except Exception as excep:
         module.fail_json(msg=str(excep))
@@ -110,6 +118,51 @@ def index_template_is_different(index_template, module):
         return True
 
 
+def manage_index_template(module, client):
+    '''
+    Brings the index template to the requested state on the cluster the client is connected to
+    '''
+    name = module.params['name']
+    state = module.params['state']
+
+    before = get_index_template(module, client, name)
+    if before is not None:
+        before = before['index_templates'][0]['index_template']
+    response = None
+
+    if before is None:
+        if state == "present":
+            if module.check_mode is False:
+                response = put_index_template(module, client, name)
+            exit_json = {
+                "changed": True,
+                "msg": "The index_template {0} was successfully created: {1}".format(name, str(response)),
+                "diff": {"after": index_template_from_file(module.params['src'])} if module._diff else None,
+            }
+            module.exit_json(**exit_json)
+        elif state == "absent":
+            module.exit_json(changed=False, msg="The index_template {0} does not exist.".format(name))
+    else:
+        if state == "present":
+            if index_template_is_different(before, module):
+                if module.check_mode is False:
+                    response = put_index_template(module, client, name)
+                exit_json = {
+                    "changed": True,
+                    "msg": "The index_template {0} was successfully updated: {1}".format(name, str(response)),
+                    "diff": {"before": before, "after": index_template_from_file(module.params['src'])} if module._diff else None,
+                }
+                module.exit_json(**exit_json)
+            else:
+                module.exit_json(changed=False, msg="The index_template {0} already exists as configured.".format(name))
+        elif state == "absent":
+            if module.check_mode is False:
+                response = client.indices.delete_index_template(name=name)  # TODO Check ack key?
+                module.exit_json(changed=True, msg="The index_template {0} was deleted.".format(name))
+            else:
+                module.exit_json(changed=True, msg="The index_template {0} was deleted.".format(name))
+
+
 # ================
 # Module execution
 #
@@ -122,6 +175,7 @@ def main():
     ]
 
     argument_spec = elastic_common_argument_spec()
+    argument_spec.update(elastic_clusters_argument_spec())
     argument_spec.update(
         name=dict(type='str', required=True),
         state=dict(type='str', choices=state_choices, default='present'),
@@ -138,49 +192,9 @@ def main():
         module.fail_json(msg=missing_required_lib('elasticsearch'),
                          exception=E_IMP_ERR)
 
-    name = module.params['name']
-    state = module.params['state']
-
     try:
         elastic = ElasticHelpers(module)
-        client = elastic.connect()
-
-        before = get_index_template(module, client, name)
-        if before is not None:
-            before = before['index_templates'][0]['index_template']
-        response = None
-
-        if before is None:
-            if state == "present":
-                if module.check_mode is False:
-                    response = put_index_template(module, client, name)
-                exit_json = {
-                    "changed": True,
-                    "msg": "The index_template {0} was successfully created: {1}".format(name, str(response)),
-                    "diff": {"after": index_template_from_file(module.params['src'])} if module._diff else None,
-                }
-                module.exit_json(**exit_json)
-            elif state == "absent":
-                module.exit_json(changed=False, msg="The index_template {0} does not exist.".format(name))
-        else:
-            if state == "present":
-                if index_template_is_different(before, module):
-                    if module.check_mode is False:
-                        response = put_index_template(module, client, name)
-                    exit_json = {
-                        "changed": True,
-                        "msg": "The index_template {0} was successfully updated: {1}".format(name, str(response)),
-                        "diff": {"before": before, "after": index_template_from_file(module.params['src'])} if module._diff else None,
-                    }
-                    module.exit_json(**exit_json)
-                else:
-                    module.exit_json(changed=False, msg="The index_template {0} already exists as configured.".format(name))
-            elif state == "absent":
-                if module.check_mode is False:
-                    response = client.indices.delete_index_template(name=name)  # TODO Check ack key?
-                    module.exit_json(changed=True, msg="The index_template {0} was deleted.".format(name))
-                else:
-                    module.exit_json(changed=True, msg="The index_template {0} was deleted.".format(name))
+        elastic.run(manage_index_template)
     except Exception as excep:
         module.fail_json(msg='Elastic error: %s' % to_native(excep))
 
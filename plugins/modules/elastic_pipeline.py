@@ -86,7 +86,8 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     E_IMP_ERR,
     elastic_common_argument_spec,
     ElasticHelpers,
-    NotFoundError
+    elastic_exceptions,
+    cached
 )
 import json
 
@@ -102,14 +103,17 @@ def add_if_not_none(dict, key, module):
     return dict
 
 
-def get_pipeline(client, name):
+def get_pipeline(module, client, name):
     '''
     Gets the pipeline specified by name
     '''
+    pipelines = cached(module, client, 'pipelines')
+    if pipelines is not None:
+        return pipelines.get(name)
     try:
         pipeline = client.ingest.get_pipeline(id=name)
         pipeline = pipeline[name]
-    except NotFoundError:
+    except elastic_exceptions.NotFoundError:
         pipeline = None
     return pipeline
 
@@ -182,7 +186,7 @@ def main():
         elastic = ElasticHelpers(module)
         client = elastic.connect()
 
-        pipeline = get_pipeline(client, name)
+        pipeline = get_pipeline(module, client, name)
 
         # We can probably refector this code to reduce by 50% by only checking when we actually change something
         if pipeline is not None:  # pipeline exists
@@ -39,6 +39,46 @@ options:
       - Wait for the command to cpmplete before continuing.
     type: bool
     default: False
+  verify:
+    description:
+      - Verify the copy once it has completed.
+      - Compares the document counts of I(source) and I(dest) and the checksums of the copied documents.
+      - The module fails when a mismatch is found.
+      - Requires I(wait_for_completion=true).
+    type: bool
+    default: False
+  verify_sample_size:
+    description:
+      - The number of randomly sampled source documents to compare against the destination.
+      - Set to 0 to compare a checksum computed over all documents of both indexes.
+        The checksums are skipped when the document counts already differ.
+      - The documents are compared by their C(_source), indexes with C(_source) disabled can't be verified.
+      - At most 10000, the default C(index.max_result_window) of a search.
+    type: int
+    default: 100
+  verify_slices:
+    description:
+      - The number of sliced scrolls run in parallel when computing the checksum over all documents.
+      - Only used when I(verify_sample_size=0).
+    type: int
+    default: 1
+  fast_write:
+    description:
+      - Set C(refresh_interval=-1) and C(number_of_replicas=0) on I(dest) for the duration of the copy.
+      - The original values are restored once the copy has finished, even if it failed.
+      - The destination is then refreshed and the module waits for it to reach I(fast_write_status).
+      - I(dest) must already exist and I(wait_for_completion=true) is required.
+    type: bool
+    default: False
+  fast_write_status:
+    description:
+      - The health status to wait for on I(dest) after the original settings have been restored.
+      - The module waits up to I(timeout) seconds and fails if the status is not reached.
+    type: str
+    choices:
+      - green
+      - yellow
+    default: green
 '''
 
 EXAMPLES = r'''
@@ -46,6 +86,30 @@ EXAMPLES = r'''
   community.elastic.elastic_reindex:
     source: myIndex1
     dest: myIndex2
+
+- name: Copy an index and verify a sample of 500 documents
+  community.elastic.elastic_reindex:
+    source: myIndex1
+    dest: myIndex2
+    wait_for_completion: yes
+    verify: yes
+    verify_sample_size: 500
+
+- name: Copy an index and verify a checksum of all documents using 4 slices
+  community.elastic.elastic_reindex:
+    source: myIndex1
+    dest: myIndex2
+    wait_for_completion: yes
+    verify: yes
+    verify_sample_size: 0
+    verify_slices: 4
+
+- name: Copy an index into a destination tuned for fast writes
+  community.elastic.elastic_reindex:
+    source: myIndex1
+    dest: myIndex2
+    wait_for_completion: yes
+    fast_write: yes
 '''
 
 RETURN = r'''
@@ -85,6 +149,52 @@ took:
   description: How long the copy took in ms.
   returned: on success when wait_for_completion is true
   type: int
+verification:
+  description: Result of the copy verification.
+  returned: when verify is true
+  type: dict
+  contains:
+    source_count:
+      description: Number of documents in the source.
+      type: int
+    dest_count:
+      description: Number of documents in the destination.
+      type: int
+    mode:
+      description: Either sample or full.
+      type: str
+    checked:
+      description: Number of documents compared.
+      type: int
+    missing:
+      description: Ids of sampled documents not found in the destination.
+      type: list
+    different:
+      description: Ids of sampled documents whose content differs in the destination.
+      type: list
+    source_checksum:
+      description: Checksum over all source documents, only computed when the document counts match.
+      type: str
+    dest_checksum:
+      description: Checksum over all destination documents, only computed when the document counts match.
+      type: str
+    took:
+      description: How long the verification took in ms.
+      type: int
+fast_write:
+  description: Details of the destination settings swap.
+  returned: when fast_write is true
+  type: dict
+  contains:
+    original_settings:
+      description: The refresh_interval and number_of_replicas of each destination index before the copy.
+      type: dict
+    status:
+      description: The health status of the destination after the settings were restored.
+      type: str
+    timings:
+      description: How long each phase (prepare, copy, restore, refresh, wait) took in ms.
+      type: dict
 '''
 
 
@@ -98,9 +208,156 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     E_IMP_ERR,
     elastic_common_argument_spec,
     ElasticHelpers,
+    timed,
+    cluster_health,
+    helpers,
     __version__
 )
 
+import hashlib
+import json
+import time
+from multiprocessing.pool import ThreadPool
+
+
+# The default index.max_result_window, larger samples fail the search
+MAX_SAMPLE_SIZE = 10000
+
+
+def document_hash(hit):
+    '''
+    Return a checksum of the id and source of a search hit.
+    Raises ValueError when the source of the document is not stored.
+    '''
+    if '_source' not in hit:
+        raise ValueError("The copy can't be verified, the document {0} of {1} has no _source.".format(hit['_id'], hit['_index']))
+    doc = json.dumps({"_id": hit['_id'], "_source": hit['_source']}, sort_keys=True)
+    return int(hashlib.sha256(doc.encode('utf-8')).hexdigest(), 16)
+
+
+def index_checksum(client, index, slices):
+    '''
+    Return an order independent checksum of all the documents in an index.
+    The per document hashes are summed so the result does not depend on
+    how the documents are split between the slices.
+    '''
+    def slice_checksum(slice_id):
+        query = {"query": {"match_all": {}}}
+        if slices > 1:
+            query['slice'] = {"id": slice_id, "max": slices}
+        checksum = 0
+        for hit in helpers.scan(client, index=index, query=query):
+            checksum = (checksum + document_hash(hit)) % (2 ** 256)
+        return checksum
+
+    pool = ThreadPool(slices)
+    try:
+        checksums = pool.map(slice_checksum, range(slices))
+    finally:
+        pool.close()
+    return "{0:064x}".format(sum(checksums) % (2 ** 256))
+
+
+def sample_documents(client, index, size):
+    '''
+    Return a random sample of documents from an index
+    '''
+    body = {
+        "size": size,
+        "query": {
+            "function_score": {
+                "query": {"match_all": {}},
+                "random_score": {}
+            }
+        }
+    }
+    response = client.search(index=index, body=body)
+    return response['hits']['hits']
+
+
+def verify_copy(client, source, dest, sample_size, slices):
+    '''
+    Compare the document counts and contents of the source and destination.
+    Returns a tuple of (success, verification details).
+    Raises ValueError when a compared document has no _source.
+    '''
+    start = time.time()
+    client.indices.refresh(index=dest)
+    source_count = client.count(index=source)['count']
+    dest_count = client.count(index=dest)['count']
+    verification = {
+        "source_count": source_count,
+        "dest_count": dest_count
+    }
+    success = source_count == dest_count
+    if sample_size == 0:
+        verification['mode'] = "full"
+        verification['checked'] = 0
+        # The checksums would scan both indexes for nothing once the counts differ
+        if success:
+            verification['checked'] = source_count
+            verification['source_checksum'] = index_checksum(client, source, slices)
+            verification['dest_checksum'] = index_checksum(client, dest, slices)
+            if verification['source_checksum'] != verification['dest_checksum']:
+                success = False
+    else:
+        verification['mode'] = "sample"
+        hits = sample_documents(client, source, sample_size)
+        missing = []
+        different = []
+        if len(hits) > 0:
+            response = client.mget(index=dest, body={"ids": [hit['_id'] for hit in hits]})
+            dest_docs = dict((doc['_id'], doc) for doc in response['docs'])
+            for hit in hits:
+                dest_doc = dest_docs.get(hit['_id'])
+                if dest_doc is None or not dest_doc.get('found', False):
+                    missing.append(hit['_id'])
+                elif document_hash(hit) != document_hash(dest_doc):
+                    different.append(hit['_id'])
+        verification['checked'] = len(hits)
+        verification['missing'] = missing
+        verification['different'] = different
+        if len(missing) > 0 or len(different) > 0:
+            success = False
+    verification['took'] = int((time.time() - start) * 1000)
+    return success, verification
+
+
+def get_write_settings(client, index):
+    '''
+    Return the refresh_interval and number_of_replicas of each index
+    matching the supplied name. Unset values are returned as None.
+    '''
+    response = client.indices.get_settings(index=index, flat_settings=True)
+    write_settings = {}
+    for name, index_settings in dict(response).items():
+        index_settings = index_settings['settings']
+        write_settings[name] = {
+            "index.refresh_interval": index_settings.get('index.refresh_interval'),
+            "index.number_of_replicas": index_settings.get('index.number_of_replicas')
+        }
+    return write_settings
+
+
+def put_write_settings(client, write_settings):
+    '''
+    Apply per index refresh_interval and number_of_replicas settings
+    '''
+    for name, index_settings in write_settings.items():
+        client.indices.put_settings(index=name, body=index_settings)
+
+
+def prepare_fast_write(client, index):
+    '''
+    Disable refreshes and replicas on the destination.
+    Returns the original settings so they can be restored.
+    '''
+    original_settings = get_write_settings(client, index)
+    fast_settings = dict((name, {"index.refresh_interval": "-1", "index.number_of_replicas": 0})
+                         for name in original_settings.keys())
+    put_write_settings(client, fast_settings)
+    return original_settings
+
 
 # ================
 # Module execution
@@ -114,6 +371,11 @@ def main():
         source=dict(type='str', required=True),
         dest=dict(type='str', required=True),
         wait_for_completion=dict(type='bool', default=False),
+        verify=dict(type='bool', default=False),
+        verify_sample_size=dict(type='int', default=100),
+        verify_slices=dict(type='int', default=1),
+        fast_write=dict(type='bool', default=False),
+        fast_write_status=dict(type='str', choices=['green', 'yellow'], default='green'),
     )
 
     module = AnsibleModule(
@@ -131,18 +393,63 @@ def main():
     source = module.params['source']
     dest = module.params['dest']
     wait_for_completion = module.params['wait_for_completion']
+    verify = module.params['verify']
+    verify_sample_size = module.params['verify_sample_size']
+    verify_slices = module.params['verify_slices']
+    fast_write = module.params['fast_write']
+    fast_write_status = module.params['fast_write_status']
+
+    if verify and not wait_for_completion:
+        module.fail_json(msg="verify requires wait_for_completion to be true.")
+    if verify_sample_size < 0 or verify_sample_size > MAX_SAMPLE_SIZE:
+        module.fail_json(msg="verify_sample_size must be between 0 and {0}.".format(MAX_SAMPLE_SIZE))
+    if verify_slices < 1:
+        module.fail_json(msg="verify_slices must be 1 or greater.")
+    if fast_write and not wait_for_completion:
+        module.fail_json(msg="fast_write requires wait_for_completion to be true.")
 
     try:
 
         elastic = ElasticHelpers(module)
         client = elastic.connect()
 
+        fast_write_result = None
+        if fast_write:
+            if not client.indices.exists(index=dest):
+                module.fail_json(msg="fast_write requires the index {0} to exist.".format(dest))
+            timings = {}
+            original_settings = timed(timings, 'prepare', prepare_fast_write, client, dest)
+            fast_write_result = {
+                "original_settings": original_settings,
+                "timings": timings
+            }
+
         reindex_arg = {"source": {"index": source}, "dest": {"index": dest}}
-        if __version__ >= (8, 0, 0):
-            reindex_arg['wait_for_completion'] = wait_for_completion
-            result = dict(client.reindex(**reindex_arg))
-        else:
-            result = dict(client.reindex(reindex_arg, wait_for_completion=wait_for_completion))
+        try:
+            start = time.time()
+            if __version__ >= (8, 0, 0):
+                reindex_arg['wait_for_completion'] = wait_for_completion
+                result = dict(client.reindex(**reindex_arg))
+            else:
+                result = dict(client.reindex(reindex_arg, wait_for_completion=wait_for_completion))
+        finally:
+            if fast_write:
+                timings['copy'] = int((time.time() - start) * 1000)
+                timed(timings, 'restore', put_write_settings, client, original_settings)
+
+        if fast_write:
+            timed(timings, 'refresh', client.indices.refresh, index=dest)
+            # The client waits for the server side timeout plus its own request timeout
+            health = dict(timed(timings, 'wait', cluster_health, client,
+                                module.params['timeout'] * 2,
+                                index=dest,
+                                wait_for_status=fast_write_status,
+                                timeout="{0}s".format(module.params['timeout'])))
+            fast_write_result['status'] = health['status']
+            if health['timed_out']:
+                module.fail_json(changed=True,
+                                 msg="The index {0} did not reach the status {1} after the copy.".format(dest, fast_write_status),
+                                 fast_write=fast_write_result)
         if isinstance(result, dict) and 'task' in list(result.keys()):
             msg = "The copy task from {0} to {1} has been started.".format(source, dest)
             module.exit_json(changed=True,
@@ -150,14 +457,30 @@ def main():
                              **result)
         elif isinstance(result, dict) and 'took' in list(result.keys()):
             msg = "The copy from {0} to {1} was successful.".format(source, dest)
+            copy_result = dict(created=result['created'],
+                               updated=result['updated'],
+                               deleted=result['deleted'],
+                               failed=len(result['failures']),
+                               took=result['took'],
+                               batches=result['batches'])
+            if fast_write_result is not None:
+                copy_result['fast_write'] = fast_write_result
+            if verify:
+                try:
+                    success, copy_result['verification'] = verify_copy(client,
+                                                                       source,
+                                                                       dest,
+                                                                       verify_sample_size,
+                                                                       verify_slices)
+                except ValueError as excep:
+                    module.fail_json(changed=True, msg=str(excep), **copy_result)
+                if not success:
+                    msg = "The copy from {0} to {1} failed verification.".format(source, dest)
+                    module.fail_json(changed=True, msg=msg, **copy_result)
+                msg += " The copy was verified."
             module.exit_json(changed=True,
                              msg=msg,
-                             created=result['created'],
-                             updated=result['updated'],
-                             deleted=result['deleted'],
-                             failed=len(result['failures']),
-                             took=result['took'],
-                             batches=result['batches'])
+                             **copy_result)
         else:
             msg = "Copy failed."
             if result is None:
@@ -21,6 +21,7 @@ version_added: "0.0.1"
 
 extends_documentation_fragment:
   - community.elastic.login_options
+  - community.elastic.login_options.clusters
 
 options:
   applications:
@@ -104,6 +105,7 @@ RETURN = r'''
 
 from ansible.module_utils.basic import AnsibleModule
 from ansible.module_utils._text import to_native
+import copy
 import json
 
 
@@ -112,8 +114,10 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     elastic_found,
     E_IMP_ERR,
     elastic_common_argument_spec,
+    elastic_clusters_argument_spec,
     ElasticHelpers,
-    NotFoundError
+    elastic_exceptions,
+    cached
 )
 
 
@@ -121,9 +125,15 @@ def get_role(module, client, name):
     '''
     Uses the get roles api to return information about the given role
     '''
+    roles = cached(module, client, 'roles')
+    if roles is not None:
+        if name in roles:
+            # role_is_different() modifies the role
+            return {name: copy.deepcopy(roles[name])}
+        return None
     try:
         response = dict(client.security.get_role(name=name))
-    except NotFoundError as excep:
+    except elastic_exceptions.NotFoundError as excep:
         response = None
     except Exception as excep:
         module.fail_json(msg=str(excep))
@@ -205,6 +215,39 @@ def _role_is_different(current_role, module):
         return True
 
 
+def manage_role(module, client):
+    '''
+    Brings the role to the requested state on the cluster the client is connected to
+    '''
+    name = module.params['name']
+    state = module.params['state']
+
+    role = get_role(module, client, name)
+    response = None
+
+    if role is None:
+        if state == "present":
+            if module.check_mode is False:
+                response = put_role(module, client, name)
+            module.exit_json(changed=True, msg="The role {0} was successfully created: {1}".format(name, str(response)))
+        elif state == "absent":
+            module.exit_json(changed=False, msg="The role {0} does not exist.".format(name))
+    else:
+        if state == "present":
+            if role_is_different(role, module):
+                if module.check_mode is False:
+                    response = put_role(module, client, name)
+                module.exit_json(changed=True, msg="The role {0} was successfully updated: {1}".format(name, str(response)))
+            else:
+                module.exit_json(changed=False, msg="The role {0} already exists as configured.".format(name))
+        elif state == "absent":
+            if module.check_mode is False:
+                response = client.security.delete_role(name=name)  # TODO Check ack key?
+                module.exit_json(changed=True, msg="The role {0} was deleted.".format(name))
+            else:
+                module.exit_json(changed=True, msg="The role {0} was deleted.".format(name))
+
+
 # ================
 # Module execution
 #
@@ -217,6 +260,7 @@ def main():
     ]
 
     argument_spec = elastic_common_argument_spec()
+    argument_spec.update(elastic_clusters_argument_spec())
     argument_spec.update(
         applications=dict(type='list', elements='dict'),
         cluster=dict(type='list', elements='str'),
@@ -238,37 +282,9 @@ def main():
         module.fail_json(msg=missing_required_lib('elasticsearch'),
                          exception=E_IMP_ERR)
 
-    name = module.params['name']
-    state = module.params['state']
-
     try:
         elastic = ElasticHelpers(module)
-        client = elastic.connect()
-
-        role = get_role(module, client, name)
-        response = None
-
-        if role is None:
-            if state == "present":
-                if module.check_mode is False:
-                    response = put_role(module, client, name)
-                module.exit_json(changed=True, msg="The role {0} was successfully created: {1}".format(name, str(response)))
-            elif state == "absent":
-                module.exit_json(changed=False, msg="The role {0} does not exist.".format(name))
-        else:
-            if state == "present":
-                if role_is_different(role, module):
-                    if module.check_mode is False:
-                        response = put_role(module, client, name)
-                    module.exit_json(changed=True, msg="The role {0} was successfully updated: {1}".format(name, str(response)))
-                else:
-                    module.exit_json(changed=False, msg="The role {0} already exists as configured.".format(name))
-            elif state == "absent":
-                if module.check_mode is False:
-                    response = client.security.delete_role(name=name)  # TODO Check ack key?
-                    module.exit_json(changed=True, msg="The role {0} was deleted.".format(name))
-                else:
-                    module.exit_json(changed=True, msg="The role {0} was deleted.".format(name))
+        elastic.run(manage_role)
     except Exception as excep:
         module.fail_json(msg='Elastic error: %s' % to_native(excep))
 
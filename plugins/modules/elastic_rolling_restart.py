@@ -0,0 +1,275 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+# Copyright: (c) 2021, Rhys Campbell (@rhysmeister) <rhys.james.campbell@googlemail.com>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+DOCUMENTATION = r'''
+---
+module: elastic_rolling_restart
+
+short_description: Restart Elasticsearch nodes one at a time.
+
+description:
+  - Restart Elasticsearch nodes one at a time.
+  - For each node shard allocation is restricted, the indexes are flushed, the node is restarted,
+    the module waits for the node to rejoin the cluster, allocation is restored and the module waits
+    for the cluster to reach the expected status.
+  - All nodes are handled in a single process using the same connection.
+  - The time taken by each phase is reported per node.
+
+author: Rhys Campbell (@rhysmeister)
+version_added: "1.2.0"
+
+extends_documentation_fragment:
+  - community.elastic.login_options
+
+options:
+  nodes:
+    description:
+      - The names of the nodes to restart, in order.
+    type: list
+    elements: str
+    required: true
+  restart_command:
+    description:
+      - The command that restarts a node.
+      - Executed on the host running the module.
+      - The string C({node}) is replaced with the node name.
+    type: str
+    required: true
+  allocation:
+    description:
+      - The value of cluster.routing.allocation.enable while a node is restarted.
+      - The original value is restored once the node has rejoined the cluster.
+      - If a node fails to rejoin the value is left in place so shards are not reallocated while the failure is investigated.
+    type: str
+    choices:
+      - primaries
+      - none
+    default: primaries
+  flush:
+    description:
+      - Flush all indexes before restarting a node to speed up shard recovery.
+    type: bool
+    default: true
+  status:
+    description:
+      - The cluster status to wait for after each node has been restarted.
+    type: str
+    choices:
+      - green
+      - yellow
+    default: green
+  interval:
+    description:
+      - The maximum number of seconds each health or node request waits server side before it is retried.
+    type: int
+    default: 10
+  wait_timeout:
+    description:
+      - The maximum number of seconds to wait for a node to rejoin and for the cluster to reach I(status).
+    type: int
+    default: 600
+'''
+
+EXAMPLES = r'''
+- name: Restart three nodes managed by systemd over ssh
+  community.elastic.elastic_rolling_restart:
+    nodes:
+      - es01
+      - es02
+      - es03
+    restart_command: "ssh {node} sudo systemctl restart elasticsearch"
+
+- name: Restart the node on the current host
+  community.elastic.elastic_rolling_restart:
+    nodes:
+      - "{{ inventory_hostname }}"
+    restart_command: "systemctl restart elasticsearch"
+    status: yellow
+'''
+
+RETURN = r'''
+msg:
+  description: A short message describing what happened.
+  returned: always
+  type: str
+nodes:
+  description: The restarted nodes and how long each phase took in ms.
+  returned: always
+  type: list
+  elements: dict
+  contains:
+    node:
+      description: The node name.
+      type: str
+    timings:
+      description: >
+        How long each of the disable_allocation, flush, restart, wait_for_node, enable_allocation
+        and wait_for_status phases took in ms.
+      type: dict
+    took:
+      description: How long the node restart took in ms.
+      type: int
+'''
+
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils._text import to_native
+
+
+from ansible_collections.community.elastic.plugins.module_utils.elastic_common import (
+    missing_required_lib,
+    elastic_found,
+    E_IMP_ERR,
+    elastic_common_argument_spec,
+    ElasticHelpers,
+    timed,
+    backoff_delay,
+    wait_for_health
+)
+import time
+
+
+ALLOCATION_SETTING = "cluster.routing.allocation.enable"
+
+
+def get_allocation(client):
+    '''
+    Return the persistent value of the allocation setting or None if it is not set
+    '''
+    response = client.cluster.get_settings(flat_settings=True)
+    return response['persistent'].get(ALLOCATION_SETTING)
+
+
+def put_allocation(client, value):
+    response = client.cluster.put_settings(body={"persistent": {ALLOCATION_SETTING: value}})
+    return response
+
+
+def node_start_time(client, node):
+    '''
+    Return the JVM start time of the named node or None when the node has not joined the cluster
+    '''
+    response = client.nodes.info(node_id=node, metric='jvm')
+    for node_info in response['nodes'].values():
+        if node_info['name'] == node:
+            return node_info['jvm']['start_time_in_millis']
+    return None
+
+
+def wait_for_node(client, node, previous_start_time, interval, wait_timeout):
+    '''
+    Wait for the node to rejoin the cluster with a new JVM start time.
+    Requests fail while the node is down so errors are retried until the timeout.
+    '''
+    start = time.time()
+    attempt = 0
+    while time.time() - start < wait_timeout:
+        attempt += 1
+        try:
+            start_time = node_start_time(client, node)
+            if start_time is not None and start_time != previous_start_time:
+                return True
+        except Exception:
+            pass
+        time.sleep(min(backoff_delay(attempt, interval), max(0, wait_timeout - (time.time() - start))))
+    return False
+
+
+def wait_for_status(client, status, interval, timeout, wait_timeout):
+    '''
+    Wait for the cluster to reach the status using server side waits
+    '''
+    return wait_for_health(client, interval, timeout, wait_timeout, wait_for_status=status)
+
+
+def restart_node(module, client, node, original_allocation):
+    '''
+    Restart a single node. Returns the per phase timings.
+    '''
+    interval = module.params['interval']
+    timeout = module.params['timeout']
+    wait_timeout = module.params['wait_timeout']
+    timings = {}
+
+    previous_start_time = node_start_time(client, node)
+    if previous_start_time is None:
+        module.fail_json(msg="The node {0} is not part of the cluster.".format(node))
+
+    timed(timings, 'disable_allocation', put_allocation, client, module.params['allocation'])
+    if module.params['flush']:
+        timed(timings, 'flush', client.indices.flush)
+
+    command = module.params['restart_command'].replace('{node}', node)
+    rc, stdout, stderr = timed(timings, 'restart', module.run_command, command)
+    if rc != 0:
+        module.fail_json(msg="The restart command for node {0} failed: {1}".format(node, stderr),
+                         rc=rc, stdout=stdout, stderr=stderr, timings=timings)
+
+    if not timed(timings, 'wait_for_node', wait_for_node, client, node, previous_start_time, interval, wait_timeout):
+        module.fail_json(msg="The node {0} did not rejoin the cluster.".format(node), timings=timings)
+
+    timed(timings, 'enable_allocation', put_allocation, client, original_allocation)
+
+    if not timed(timings, 'wait_for_status', wait_for_status, client, module.params['status'], interval, timeout, wait_timeout):
+        module.fail_json(msg="The cluster did not reach the status {0} after restarting node {1}.".format(module.params['status'], node),
+                         timings=timings)
+    return timings
+
+
+# ================
+# Module execution
+#
+
+def main():
+
+    argument_spec = elastic_common_argument_spec()
+    argument_spec.update(
+        nodes=dict(type='list', elements='str', required=True),
+        restart_command=dict(type='str', required=True),
+        allocation=dict(type='str', choices=['primaries', 'none'], default='primaries'),
+        flush=dict(type='bool', default=True),
+        status=dict(type='str', choices=['green', 'yellow'], default='green'),
+        interval=dict(type='int', default=10),
+        wait_timeout=dict(type='int', default=600),
+    )
+
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=False,
+        required_together=[['login_user', 'login_password']],
+    )
+
+    if not elastic_found:
+        module.fail_json(msg=missing_required_lib('elasticsearch'),
+                         exception=E_IMP_ERR)
+
+    nodes = module.params['nodes']
+
+    try:
+        elastic = ElasticHelpers(module)
+        client = elastic.connect()
+
+        original_allocation = get_allocation(client)
+        results = []
+        for node in nodes:
+            start = time.time()
+            timings = restart_node(module, client, node, original_allocation)
+            results.append(dict(node=node,
+                                timings=timings,
+                                took=int((time.time() - start) * 1000)))
+
+        module.exit_json(changed=True,
+                         msg="The nodes {0} were restarted.".format(", ".join(nodes)),
+                         nodes=results)
+    except Exception as excep:
+        module.fail_json(msg='Elastic error: %s' % to_native(excep))
+
+
+if __name__ == '__main__':
+    main()
@@ -111,7 +111,7 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     E_IMP_ERR,
     elastic_common_argument_spec,
     ElasticHelpers,
-    NotFoundError
+    elastic_exceptions
 )
 
 
@@ -122,7 +122,7 @@ def get_snapshot(module, client, repository, name):
     try:
         response = dict(client.snapshot.get(repository=repository,
                                             snapshot=name))
-    except NotFoundError as excep:
+    except elastic_exceptions.NotFoundError as excep:
         response = None
     except Exception as excep:
         module.fail_json(msg=str(excep))
@@ -82,7 +82,7 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     E_IMP_ERR,
     elastic_common_argument_spec,
     ElasticHelpers,
-    NotFoundError,
+    elastic_exceptions,
     __version__
 )
 
@@ -94,7 +94,7 @@ def get_snapshot_repository(module, client, name):
     try:
         name_arg = {('repository', 'name')[__version__ >= (8, 0, 0)]: name}
         response = dict(client.snapshot.get_repository(**name_arg))
-    except NotFoundError as excep:
+    except elastic_exceptions.NotFoundError as excep:
         response = None
     except Exception as excep:
         module.fail_json(msg=str(excep))
@@ -233,7 +233,7 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     E_IMP_ERR,
     elastic_common_argument_spec,
     ElasticHelpers,
-    NotFoundError
+    elastic_exceptions
 )
 import json
 
@@ -256,7 +256,7 @@ def get_transform_job(client, name):
     try:
         response = client.transform.get_transform(transform_id=name)
         job_config = response["transforms"][0]
-    except NotFoundError:
+    except elastic_exceptions.NotFoundError:
         job_config = None
     return job_config
 
@@ -272,7 +272,7 @@ def get_transform_state(client, name):
             state = job['state']
         else:
             state = "nostate"
-    except NotFoundError:
+    except elastic_exceptions.NotFoundError:
         state = "notfound"
     return state
 
@@ -108,7 +108,8 @@ from ansible_collections.community.elastic.plugins.module_utils.elastic_common i
     E_IMP_ERR,
     elastic_common_argument_spec,
     ElasticHelpers,
-    NotFoundError
+    elastic_exceptions,
+    cached
 )
 
 
@@ -116,9 +117,14 @@ def get_user(module, client, name):
     '''
     Uses the get user api to return information about the given user
     '''
+    users = cached(module, client, 'users')
+    if users is not None:
+        if name in users:
+            return {name: users[name]}
+        return None
     try:
         response = dict(client.security.get_user(username=name))
-    except NotFoundError as excep:
+    except elastic_exceptions.NotFoundError as excep:
         response = None
     except Exception as excep:
         module.fail_json(msg=str(excep))
@@ -0,0 +1,60 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Compare the response size and latency of the read requests made by the
+# modules with and without filter_path. Run it against a large cluster to see
+# the difference, the requests are sent with the standard library only.
+#
+# python tests/benchmark/filter_path.py [url] [runs]
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import sys
+import time
+
+try:
+    from urllib.request import urlopen
+except ImportError:
+    from urllib2 import urlopen
+
+REQUESTS = [
+    ("elastic_cluster_settings",
+     "/_cluster/settings?include_defaults=true&flat_settings=true",
+     "/_cluster/settings?include_defaults=true&filter_path=persistent.cluster.routing.allocation.enable,"
+     "transient.cluster.routing.allocation.enable,defaults.cluster.routing.allocation.enable"),
+    ("elastic_index_info",
+     "/*",
+     "/*?filter_path=*.settings.index.number_of_shards,*.settings.index.number_of_replicas"),
+    ("elastic_cluster_health",
+     "/_cluster/health?level=indices",
+     "/_cluster/health?level=indices&filter_path=status,timed_out"),
+]
+
+
+def measure(url, runs):
+    '''
+    Return the response size in bytes and the best latency in ms of url
+    '''
+    timings = []
+    size = 0
+    for run in range(runs):
+        start = time.time()
+        response = urlopen(url)
+        size = len(response.read())
+        timings.append((time.time() - start) * 1000)
+    return size, min(timings)
+
+
+def main():
+    base_url = sys.argv[1].rstrip('/') if len(sys.argv) > 1 else 'http://localhost:9200'
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    print("{0:26} {1:>12} {2:>10} {3:>12} {4:>10}".format('module', 'full bytes', 'full ms', 'filtered', 'ms'))
+    for module, full, filtered in REQUESTS:
+        full_size, full_ms = measure(base_url + full, runs)
+        filtered_size, filtered_ms = measure(base_url + filtered, runs)
+        print("{0:26} {1:12} {2:10.1f} {3:12} {4:10.1f}".format(module, full_size, full_ms, filtered_size, filtered_ms))
+
+
+if __name__ == '__main__':
+    main()
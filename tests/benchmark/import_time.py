@@ -0,0 +1,58 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# Measure how long importing each module of the collection takes compared to
+# importing the elasticsearch library. Every measurement runs in a fresh
+# interpreter so nothing is cached between runs.
+#
+# The collection must be checked out as ansible_collections/community/elastic
+# as described in the README.
+#
+# python tests/benchmark/import_time.py [runs]
+
+from __future__ import absolute_import, division, print_function
+__metaclass__ = type
+
+import os
+import subprocess
+import sys
+
+COLLECTION_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+COLLECTIONS_PATH = os.path.abspath(os.path.join(COLLECTION_ROOT, '..', '..', '..'))
+MODULE_PACKAGE = 'ansible_collections.community.elastic.plugins.modules'
+
+TIMER = '''
+import time
+start = time.time()
+import {0}
+print(time.time() - start)
+'''
+
+
+def import_time(name, runs):
+    '''
+    Return the best import time of name in ms over the given number of runs
+    '''
+    env = dict(os.environ)
+    env['PYTHONPATH'] = os.pathsep.join([COLLECTIONS_PATH, env.get('PYTHONPATH', '')])
+    env['PYTHONDONTWRITEBYTECODE'] = '1'
+    timings = []
+    for run in range(runs):
+        output = subprocess.check_output([sys.executable, '-c', TIMER.format(name)], env=env)
+        timings.append(float(output.decode('utf-8').strip()) * 1000)
+    return min(timings)
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    modules = sorted(f[:-3] for f in os.listdir(os.path.join(COLLECTION_ROOT, 'plugins', 'modules'))
+                     if f.endswith('.py') and not f.startswith('_'))
+    print("{0:40} {1:>10}".format('import', 'best ms'))
+    for name in ['elasticsearch', 'elasticsearch.helpers']:
+        print("{0:40} {1:10.1f}".format(name, import_time(name, runs)))
+    for module in modules:
+        print("{0:40} {1:10.1f}".format(module, import_time("{0}.{1}".format(MODULE_PACKAGE, module), runs)))
+
+
+if __name__ == '__main__':
+    main()